@@ -31,6 +31,19 @@ class Config:
     
     TIMEFRAMES = ['1m', '3m', '5m', '15m', '30m', '1h', '2h', '4h', '6h', '12h', '1d']
     
+    # Duração de cada candle em segundos
+    TIMEFRAME_SECONDS = {
+        '1m': 60, '3m': 180, '5m': 300, '15m': 900, '30m': 1800, '1h': 3600,
+        '2h': 7200, '4h': 14400, '6h': 21600, '12h': 43200, '1d': 86400
+    }
+    
+    # Validade máxima do cache de candles (segundos)
+    DATA_CACHE_TTL = 300
+    
+    # Posições nos selectboxes (consulta O(1) em vez de list.index a cada rerun)
+    SYMBOL_INDEX = {s: i for i, s in enumerate(SYMBOLS)}
+    TIMEFRAME_INDEX = {t: i for i, t in enumerate(TIMEFRAMES)}
+    
     COLORS = {
         'bullish': '#00ff88',
         'bearish': '#ff4444',
@@ -75,9 +88,11 @@ class RealDataProvider:
         """Atualiza preços continuamente"""
         while self.running:
             try:
+                # Uma única requisição para todos os símbolos
+                real_prices = self._get_real_binance_prices(Config.SYMBOLS)
+                
                 for symbol in Config.SYMBOLS:
-                    # Primeiro tenta API real
-                    real_price = self._get_real_binance_price(symbol)
+                    real_price = real_prices.get(symbol)
                     
                     if real_price:
                         self.real_time_prices[symbol] = real_price
@@ -92,33 +107,35 @@ class RealDataProvider:
                 print(f"❌ Erro na atualização: {str(e)}")
                 time.sleep(5)
     
-    def _get_real_binance_price(self, symbol: str) -> Optional[Dict]:
-        """Tenta obter preço real da Binance"""
+    def _get_real_binance_prices(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Tenta obter preços reais da Binance (ticker 24h em lote)"""
+        prices = {}
         try:
             url = "https://api.binance.com/api/v3/ticker/24hr"
-            response = requests.get(url, params={'symbol': symbol}, timeout=5)
+            params = {'symbols': json.dumps(symbols, separators=(',', ':'))}
+            response = requests.get(url, params=params, timeout=5)
             
             if response.status_code == 200:
-                data = response.json()
-                
-                price_info = {
-                    'symbol': symbol,
-                    'price': float(data['lastPrice']),
-                    'change_percent': float(data['priceChangePercent']),
-                    'high': float(data['highPrice']),
-                    'low': float(data['lowPrice']),
-                    'volume': float(data['volume']),
-                    'timestamp': datetime.now(),
-                    'source': 'binance_api'
-                }
+                now = datetime.now()
                 
-                print(f"✅ Preço real obtido: {symbol} = ${price_info['price']:,.2f}")
-                return price_info
+                for data in response.json():
+                    symbol = data['symbol']
+                    prices[symbol] = {
+                        'symbol': symbol,
+                        'price': float(data['lastPrice']),
+                        'change_percent': float(data['priceChangePercent']),
+                        'high': float(data['highPrice']),
+                        'low': float(data['lowPrice']),
+                        'volume': float(data['volume']),
+                        'timestamp': now,
+                        'source': 'binance_api'
+                    }
+                    print(f"✅ Preço real obtido: {symbol} = ${prices[symbol]['price']:,.2f}")
                 
         except Exception as e:
-            print(f"⚠️ API Binance falhou para {symbol}: {str(e)}")
+            print(f"⚠️ API Binance falhou: {str(e)}")
         
-        return None
+        return prices
     
     def _simulate_realistic_price(self, symbol: str):
         """Simula preço realista baseado nos valores atuais"""
@@ -177,10 +194,10 @@ class RealDataProvider:
         
         # Verifica cache
         cache_key = f"{symbol}_{timeframe}_{limit}"
-        if cache_key in self.cache:
-            cache_time, data = self.cache[cache_key]
-            if (datetime.now() - cache_time).seconds < 300:  # 5 minutos
-                return data
+        bucket = self._cache_bucket(timeframe)
+        data = self._get_cached_data(cache_key, bucket)
+        if data is not None:
+            return data
         
         # Tenta API real primeiro
         data = self._get_real_binance_data(symbol, timeframe, limit)
@@ -190,10 +207,31 @@ class RealDataProvider:
             data = self._generate_realistic_data(symbol, timeframe, limit)
         
         if data is not None:
-            self.cache[cache_key] = (datetime.now(), data)
+            self.cache[cache_key] = (bucket, data)
         
         return data
     
+    def _cache_bucket(self, timeframe: str) -> int:
+        """Janela de validade do cache: vira a cada candle novo (no máximo a cada 5 minutos)"""
+        ttl = min(Config.TIMEFRAME_SECONDS.get(timeframe, 60), Config.DATA_CACHE_TTL)
+        return int(time.time() // ttl)
+    
+    def _get_cached_data(self, cache_key: str, bucket: int) -> Optional[pd.DataFrame]:
+        """Retorna dados do cache se ainda forem da janela atual"""
+        entry = self.cache.get(cache_key)
+        if entry is not None and entry[0] == bucket:
+            return entry[1]
+        return None
+    
+    def has_cached_data(self, symbol: str, timeframe: str, limit: int = 500) -> bool:
+        """Indica se get_data responderá do cache, sem bloquear"""
+        cache_key = f"{symbol}_{timeframe}_{limit}"
+        return self._get_cached_data(cache_key, self._cache_bucket(timeframe)) is not None
+    
+    def invalidate(self, symbol: str, timeframe: str, limit: int = 500):
+        """Descarta os candles em cache para forçar nova busca"""
+        self.cache.pop(f"{symbol}_{timeframe}_{limit}", None)
+    
     def _get_real_binance_data(self, symbol: str, timeframe: str, limit: int) -> Optional[pd.DataFrame]:
         """Tenta obter dados reais da Binance"""
         try:
@@ -343,13 +381,94 @@ class RealDataProvider:
         """Para atualizações"""
         self.running = False
 
+# Uma única instância por processo: a thread de preços e o cache de candles
+# sobrevivem aos reruns em vez de serem recriados a cada interação
+@st.cache_resource(show_spinner=False)
+def get_data_provider() -> RealDataProvider:
+    """Obtém o provedor de dados compartilhado"""
+    return RealDataProvider()
+
+# Figura do gráfico por símbolo/timeframe/candles; o DataFrame é identificado
+# pela janela de candles e pela última linha inteira (o candle em formação
+# pode mudar máxima/mínima/volume sem mudar o fechamento), sem hashear o
+# conteúdo todo
+@st.cache_data(
+    max_entries=32,
+    show_spinner=False,
+    hash_funcs={pd.DataFrame: lambda d: (
+        d.index[0], d.index[-1], len(d),
+        d[['open', 'high', 'low', 'close', 'volume']].iloc[-1].to_numpy().tobytes()
+    )}
+)
+def build_price_chart(symbol: str, timeframe: str, df: pd.DataFrame) -> go.Figure:
+    """Monta o gráfico de candles e volume"""
+    # Cria gráfico
+    fig = make_subplots(
+        rows=2, cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.05,
+        subplot_titles=(f'{symbol} - {timeframe} (Preços Reais)', 'Volume'),
+        row_heights=[0.75, 0.25]
+    )
+    
+    # Colunas como arrays NumPy (evita conversão por Series no Plotly)
+    opens = df['open'].to_numpy(dtype=np.float64)
+    closes = df['close'].to_numpy(dtype=np.float64)
+    
+    # Candlestick
+    fig.add_trace(
+        go.Candlestick(
+            x=df.index,
+            open=opens,
+            high=df['high'].to_numpy(dtype=np.float64),
+            low=df['low'].to_numpy(dtype=np.float64),
+            close=closes,
+            name="Preço",
+            increasing_line_color=Config.COLORS['bullish'],
+            decreasing_line_color=Config.COLORS['bearish']
+        ),
+        row=1, col=1
+    )
+    
+    # Volume
+    colors = np.where(closes < opens, Config.COLORS['bearish'], Config.COLORS['bullish'])
+    
+    fig.add_trace(
+        go.Bar(
+            x=df.index,
+            y=df['volume'].to_numpy(dtype=np.float64),
+            name="Volume",
+            marker_color=colors,
+            opacity=0.7,
+            showlegend=False
+        ),
+        row=2, col=1
+    )
+    
+    # Layout
+    fig.update_layout(
+        title=f"{symbol} - {timeframe} (Preços Atualizados)",
+        yaxis_title="Preço (USDT)",
+        yaxis2_title="Volume",
+        template="plotly_dark",
+        height=600,
+        showlegend=False,
+        xaxis_rangeslider_visible=False,
+        # Preserva zoom/pan entre reruns do mesmo símbolo/timeframe
+        uirevision=f"{symbol}:{timeframe}"
+    )
+    
+    fig.update_xaxes(type='date')
+    
+    return fig
+
 # =============================================================================
 # DASHBOARD ATUALIZADO
 # =============================================================================
 
 class TradingDashboard:
     def __init__(self):
-        self.data_provider = RealDataProvider()
+        self.data_provider = get_data_provider()
         self.setup_page()
         self.init_session_state()
     
@@ -433,7 +552,6 @@ class TradingDashboard:
         defaults = {
             'symbol': 'BTCUSDT',
             'timeframe': '1h',
-            'data': None,
             'last_update': None
         }
         
@@ -483,23 +601,21 @@ class TradingDashboard:
         symbol = st.sidebar.selectbox(
             "Símbolo:",
             Config.SYMBOLS,
-            index=Config.SYMBOLS.index(st.session_state.symbol) if st.session_state.symbol in Config.SYMBOLS else 0
+            index=Config.SYMBOL_INDEX.get(st.session_state.symbol, 0)
         )
         
         if symbol != st.session_state.symbol:
             st.session_state.symbol = symbol
-            st.session_state.data = None
         
         # Timeframe
         timeframe = st.sidebar.selectbox(
             "Timeframe:",
             Config.TIMEFRAMES,
-            index=Config.TIMEFRAMES.index(st.session_state.timeframe) if st.session_state.timeframe in Config.TIMEFRAMES else 5
+            index=Config.TIMEFRAME_INDEX.get(st.session_state.timeframe, Config.TIMEFRAME_INDEX['1h'])
         )
         
         if timeframe != st.session_state.timeframe:
             st.session_state.timeframe = timeframe
-            st.session_state.data = None
         
         # Status em tempo real
         st.sidebar.markdown("---")
@@ -527,13 +643,12 @@ class TradingDashboard:
         
         with col1:
             if st.button("🔄 Atualizar", use_container_width=True):
-                st.session_state.data = None
+                self.data_provider.invalidate(st.session_state.symbol, st.session_state.timeframe)
                 st.rerun()
         
         with col2:
             if st.button("💰 Bitcoin", use_container_width=True):
                 st.session_state.symbol = 'BTCUSDT'
-                st.session_state.data = None
                 st.rerun()
     
     def render_chart(self):
@@ -569,69 +684,21 @@ class TradingDashboard:
             else:
                 st.info("🔄 Carregando preço...")
         
-        # Carrega dados históricos
-        if st.session_state.data is None:
+        # Carrega dados históricos do cache compartilhado do provedor (por
+        # símbolo/timeframe, renovado a cada candle); spinner só com cache frio
+        if self.data_provider.has_cached_data(symbol, timeframe, 500):
+            df = self.data_provider.get_data(symbol, timeframe, 500)
+        else:
             with st.spinner("📊 Carregando dados históricos..."):
-                st.session_state.data = self.data_provider.get_data(symbol, timeframe, 500)
+                df = self.data_provider.get_data(symbol, timeframe, 500)
                 st.session_state.last_update = datetime.now()
         
-        df = st.session_state.data
-        
         if df is not None and not df.empty:
-            # Cria gráfico
-            fig = make_subplots(
-                rows=2, cols=1,
-                shared_xaxes=True,
-                vertical_spacing=0.05,
-                subplot_titles=(f'{symbol} - {timeframe} (Preços Reais)', 'Volume'),
-                row_heights=[0.75, 0.25]
-            )
-            
-            # Candlestick
-            fig.add_trace(
-                go.Candlestick(
-                    x=df.index,
-                    open=df['open'],
-                    high=df['high'],
-                    low=df['low'],
-                    close=df['close'],
-                    name="Preço",
-                    increasing_line_color=Config.COLORS['bullish'],
-                    decreasing_line_color=Config.COLORS['bearish']
-                ),
-                row=1, col=1
-            )
-            
-            # Volume
-            colors = [Config.COLORS['bearish'] if close < open else Config.COLORS['bullish'] 
-                     for close, open in zip(df['close'], df['open'])]
-            
-            fig.add_trace(
-                go.Bar(
-                    x=df.index,
-                    y=df['volume'],
-                    name="Volume",
-                    marker_color=colors,
-                    opacity=0.7,
-                    showlegend=False
-                ),
-                row=2, col=1
-            )
-            
-            # Layout
-            fig.update_layout(
-                title=f"{symbol} - {timeframe} (Preços Atualizados)",
-                yaxis_title="Preço (USDT)",
-                yaxis2_title="Volume",
-                template="plotly_dark",
-                height=600,
-                showlegend=False,
-                xaxis_rangeslider_visible=False
-            )
-            
-            fig.update_xaxes(type='date')
+            # Figura em cache: reruns sem candle novo não reconstroem o Plotly
+            fig = build_price_chart(symbol, timeframe, df)
             
-            st.plotly_chart(fig, use_container_width=True)
+            # Key fixa: o navegador atualiza o gráfico existente em vez de remontá-lo
+            st.plotly_chart(fig, use_container_width=True, key='price_chart')
             
             # Métricas
             self.render_metrics(df, current_price)
@@ -640,7 +707,6 @@ class TradingDashboard:
             st.error("❌ Não foi possível carregar dados")
             
             if st.button("🔄 Tentar Novamente", type="primary"):
-                st.session_state.data = None
                 st.rerun()
     
     def render_metrics(self, df: pd.DataFrame, current_price: Optional[Dict]):
@@ -655,12 +721,14 @@ class TradingDashboard:
             low_24h = current_price['low']
             volume_24h = current_price['volume']
         else:
-            price = df['close'].iloc[-1]
-            prev_price = df['close'].iloc[-2] if len(df) > 1 else price
+            # Arrays NumPy lidos uma vez (df já vem ordenado por tempo)
+            closes = df['close'].to_numpy()
+            price = closes[-1]
+            prev_price = closes[-2] if len(closes) > 1 else price
             change_pct = ((price - prev_price) / prev_price) * 100 if prev_price != 0 else 0
-            high_24h = df['high'].max()
-            low_24h = df['low'].min()
-            volume_24h = df['volume'].sum()
+            high_24h = df['high'].to_numpy().max()
+            low_24h = df['low'].to_numpy().min()
+            volume_24h = df['volume'].to_numpy().sum()
         
         # Métricas
         col1, col2, col3, col4, col5 = st.columns(5)
@@ -687,12 +755,17 @@ class TradingDashboard:
                 market_cap = price * 19.7  # ~19.7M BTC em circulação
                 st.metric("💎 Market Cap", f"${market_cap/1e12:.2f}T")
             else:
-                # RSI para outros
-                delta = df['close'].diff()
-                gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-                loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-                rs = gain / loss
-                rsi = 100 - (100 / (1 + rs)).iloc[-1] if len(rs) > 0 and not np.isnan(rs.iloc[-1]) else 50
+                # RSI para outros: só o último valor é exibido, então basta a
+                # média das 14 últimas variações (sem rolling na série toda)
+                closes = df['close'].to_numpy(dtype=np.float64)
+                rs_last = np.nan
+                if len(closes) >= 14:
+                    delta = np.diff(closes[-15:])
+                    gain = delta[delta > 0].sum() / 14
+                    loss = -delta[delta < 0].sum() / 14
+                    with np.errstate(divide='ignore', invalid='ignore'):
+                        rs_last = np.float64(gain) / loss
+                rsi = 100 - (100 / (1 + rs_last)) if not np.isnan(rs_last) else 50
                 rsi_color = "🟢" if 30 <= rsi <= 70 else ("🔴" if rsi > 70 else "🟡")
                 st.metric(f"📊 RSI {rsi_color}", f"{rsi:.1f}")
         
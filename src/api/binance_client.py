@@ -11,14 +11,104 @@ import asyncio
 import websocket
 import json
 import threading
+import queue
 import time
-from typing import Dict, List, Optional, Callable, Any
+from collections import deque
+from typing import Dict, List, Optional, Callable, Any, Tuple, NamedTuple
 from datetime import datetime, timedelta
+import numpy as np
 import pandas as pd
 import requests
 
-from ..config.settings import TradingConfig
+from ..config.settings import (
+    TradingConfig, OPERATION_MODES, BINANCE_API_URLS, API_TIMEOUT,
+    validate_credentials_format, clear_validation_cache
+)
 from ..utils.logger import trading_logger
+from ..utils.cache import LRUCache
+
+
+class Tick(NamedTuple):
+    """Atualização de ticker recebida via WebSocket."""
+    symbol: str
+    price: float
+    change_percent: float
+    volume: float
+    timestamp: int  # epoch ms (event time)
+
+
+class Candle(NamedTuple):
+    """Candlestick recebido via WebSocket."""
+    symbol: str
+    timestamp: int  # epoch ms (abertura do candle)
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    is_closed: bool
+
+
+def parse_ticker(payload: Dict[str, Any]) -> Tick:
+    """Converte o payload de um stream @ticker em Tick."""
+    return Tick(
+        payload['s'],
+        float(payload.get('c', 0)),
+        float(payload.get('P', 0)),
+        float(payload.get('v', 0)),
+        payload.get('E', 0)
+    )
+
+
+def parse_kline(kline: Dict[str, Any]) -> Candle:
+    """Converte o campo 'k' de um stream @kline em Candle."""
+    return Candle(
+        kline.get('s'),
+        kline.get('t', 0),
+        float(kline.get('o', 0)),
+        float(kline.get('h', 0)),
+        float(kline.get('l', 0)),
+        float(kline.get('c', 0)),
+        float(kline.get('v', 0)),
+        kline.get('x', False)
+    )
+
+
+def ohlcv_to_frame(rows: List[List[Any]]) -> pd.DataFrame:
+    """
+    Converte linhas de klines/OHLCV em DataFrame indexado por timestamp.
+    
+    As seis primeiras colunas são convertidas de uma vez para um bloco
+    float64 (a API REST envia preços como string), sem DataFrame
+    intermediário com as 12 colunas nem pd.to_numeric por coluna.
+    """
+    values = np.array([row[:6] for row in rows], dtype=np.float64).reshape(-1, 6)
+    
+    index = pd.to_datetime(values[:, 0].astype(np.int64), unit='ms')
+    index.name = 'timestamp'
+    
+    return pd.DataFrame(
+        values[:, 1:], index=index,
+        columns=['open', 'high', 'low', 'close', 'volume']
+    )
+
+
+# Sentinela que encerra a thread de dispatch
+_STOP_DISPATCH = object()
+
+
+def ts_to_dt(ms: int) -> datetime:
+    """
+    Converte timestamp epoch em milissegundos (formato da Binance) para datetime.
+    
+    Args:
+        ms: Timestamp em milissegundos
+        
+    Returns:
+        Datetime no horário local
+    """
+    return datetime.fromtimestamp(ms / 1000)
+
 
 class BinanceClient:
     """
@@ -32,6 +122,29 @@ class BinanceClient:
         self.ws_connection = None
         self.ws_thread = None
         
+        # Sessão HTTP reutilizada pela API pública (keep-alive + gzip)
+        self.http_session = requests.Session()
+        self.http_session.headers['Accept-Encoding'] = 'gzip, deflate'
+        
+        # Símbolos assinados no stream combinado público (limitado a 5) e
+        # URL fixa do stream; só eles recebem ticks em tempo real
+        self.streamed_symbols = frozenset(TradingConfig.PUBLIC_SYMBOLS[:5])
+        self._ws_url = 'wss://stream.binance.com:9443/stream?streams=' + '/'.join(
+            f'{s.lower()}@ticker/{s.lower()}@kline_1m'
+            for s in TradingConfig.PUBLIC_SYMBOLS[:5]
+        )
+        
+        # Fila de eventos do WebSocket, drenada em lotes por outra thread
+        self._event_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._dispatch_thread = None
+        self._dispatch_stopping = False
+        
+        # Controle de reconexão do WebSocket público; o evento interrompe a
+        # espera do backoff (disconnect ou novo início)
+        self._ws_should_run = False
+        self._ws_reconnect_attempts = 0
+        self._ws_wakeup = threading.Event()
+        
         # Estados de conexão
         self.is_connected = False
         self.is_authenticated = False
@@ -41,18 +154,19 @@ class BinanceClient:
         self.current_symbol = 'BTCUSDT'
         self.current_timeframe = '1h'
         
-        # Callbacks para dados em tempo real
-        self.price_callbacks: List[Callable] = []
-        self.kline_callbacks: List[Callable] = []
+        # Callbacks para dados em tempo real (tuplas imutáveis, substituídas
+        # a cada registro - o dispatch itera sem lock)
+        self.price_callbacks: Tuple[Callable, ...] = ()
+        self.kline_callbacks: Tuple[Callable, ...] = ()
         
-        # Cache de dados
-        self.symbol_info_cache = {}
-        self.price_cache = {}
-        self.kline_cache = {}
+        # Cache de dados (LRU limitado por símbolo)
+        self.symbol_info_cache = LRUCache(TradingConfig.SYMBOL_INFO_CACHE_SIZE)
+        self.price_cache = LRUCache(TradingConfig.PRICE_CACHE_SIZE)
+        self.kline_cache = LRUCache(TradingConfig.KLINE_CACHE_SYMBOLS)
         
         # Credenciais temporárias (apenas em memória)
         self.temp_credentials = None
-        self.credentials_timestamp = None
+        self.credentials_deadline: Optional[float] = None  # time.monotonic()
         
         trading_logger.log_info("Cliente Binance inicializado em modo DEMO", 'api')
     
@@ -66,12 +180,12 @@ class BinanceClient:
         Returns:
             True se modo definido com sucesso
         """
-        if mode not in TradingConfig.OPERATION_MODES:
+        if mode not in OPERATION_MODES:
             trading_logger.log_error(f"Modo inválido: {mode}")
             return False
         
         self.operation_mode = mode
-        mode_config = TradingConfig.get_operation_mode_config(mode)
+        mode_config = OPERATION_MODES[mode]
         
         trading_logger.log_info(f"Modo alterado para: {mode_config['name']}", 'api')
         
@@ -98,11 +212,11 @@ class BinanceClient:
             Dicionário com resultado da autenticação
         """
         # Validação inicial de formato
-        validation = TradingConfig.validate_credentials_format(api_key, api_secret)
+        validation = validate_credentials_format(api_key, api_secret)
         if not validation['valid']:
             return {
                 'success': False,
-                'errors': validation['errors'],
+                'errors': list(validation['errors']),
                 'message': 'Formato das credenciais inválido'
             }
         
@@ -114,10 +228,13 @@ class BinanceClient:
             exchange_config = {
                 'apiKey': api_key.strip(),
                 'secret': api_secret.strip(),
-                'timeout': TradingConfig.API_TIMEOUT * 1000,
+                'timeout': API_TIMEOUT * 1000,
                 'enableRateLimit': True,
+                'rateLimit': TradingConfig.CCXT_RATE_LIMIT_MS,
                 'options': {
                     'adjustForTimeDifference': True,
+                    'recvWindow': TradingConfig.BINANCE_RECV_WINDOW,
+                    'warnOnFetchOpenOrdersWithoutSymbol': False,
                 }
             }
             
@@ -126,17 +243,17 @@ class BinanceClient:
                 if testnet:
                     exchange_config['sandbox'] = True
                     exchange_config['urls'] = {
-                        'api': TradingConfig.BINANCE_API_URLS['futures_testnet'],
+                        'api': BINANCE_API_URLS['futures_testnet'],
                     }
                 else:
                     exchange_config['urls'] = {
-                        'api': TradingConfig.BINANCE_API_URLS['futures_mainnet'],
+                        'api': BINANCE_API_URLS['futures_mainnet'],
                     }
             else:  # spot
                 if testnet:
                     exchange_config['sandbox'] = True
                     exchange_config['urls'] = {
-                        'api': TradingConfig.BINANCE_API_URLS['testnet'],
+                        'api': BINANCE_API_URLS['testnet'],
                     }
             
             # Inicializa o exchange
@@ -154,7 +271,7 @@ class BinanceClient:
                 'testnet': testnet,
                 'account_type': account_type
             }
-            self.credentials_timestamp = datetime.now()
+            self.credentials_deadline = time.monotonic() + TradingConfig.CREDENTIALS_TIMEOUT * 60
             
             # Define estados
             self.is_connected = True
@@ -217,10 +334,13 @@ class BinanceClient:
     def _clear_credentials(self):
         """Limpa credenciais da memória."""
         self.temp_credentials = None
-        self.credentials_timestamp = None
+        self.credentials_deadline = None
         self.is_authenticated = False
         if hasattr(self, 'exchange'):
             self.exchange = None
+        
+        # Descarta resultados memoizados da validação de formato
+        clear_validation_cache()
     
     def _check_credentials_timeout(self) -> bool:
         """
@@ -229,13 +349,10 @@ class BinanceClient:
         Returns:
             True se credenciais ainda válidas
         """
-        if not self.credentials_timestamp:
+        if not self.credentials_deadline:
             return False
         
-        timeout_minutes = TradingConfig.CREDENTIALS_TIMEOUT
-        elapsed = datetime.now() - self.credentials_timestamp
-        
-        if elapsed.total_seconds() > (timeout_minutes * 60):
+        if time.monotonic() > self.credentials_deadline:
             trading_logger.log_warning("Credenciais expiraram por timeout", 'api')
             self._clear_credentials()
             return False
@@ -253,8 +370,8 @@ class BinanceClient:
             Dados de preço ou None em caso de erro
         """
         try:
-            url = f"https://api.binance.com/api/v3/ticker/24hr?symbol={symbol}"
-            response = requests.get(url, timeout=10)
+            url = f"{BINANCE_API_URLS['mainnet']}/api/v3/ticker/24hr"
+            response = self.http_session.get(url, params={'symbol': symbol}, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -290,31 +407,17 @@ class BinanceClient:
             DataFrame com dados históricos
         """
         try:
-            url = "https://api.binance.com/api/v3/klines"
+            url = f"{BINANCE_API_URLS['mainnet']}/api/v3/klines"
             params = {
                 'symbol': symbol,
                 'interval': timeframe,
                 'limit': min(limit, 1000)  # Máximo da API pública
             }
             
-            response = requests.get(url, params=params, timeout=30)
+            response = self.http_session.get(url, params=params, timeout=30)
             
             if response.status_code == 200:
-                data = response.json()
-                
-                df = pd.DataFrame(data, columns=[
-                    'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                    'close_time', 'quote_asset_volume', 'number_of_trades',
-                    'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
-                ])
-                
-                # Converte tipos
-                df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-                for col in ['open', 'high', 'low', 'close', 'volume']:
-                    df[col] = pd.to_numeric(df[col])
-                
-                df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
-                df.set_index('timestamp', inplace=True)
+                df = ohlcv_to_frame(response.json())
                 
                 trading_logger.log_info(
                     f"Dados históricos públicos obtidos: {symbol} - {len(df)} candles", 'api'
@@ -329,121 +432,202 @@ class BinanceClient:
             return None
     
     def _start_public_websocket(self):
-        """Inicia WebSocket público para dados em tempo real."""
+        """
+        Inicia WebSocket público para dados em tempo real.
+        
+        A conexão é refeita automaticamente com backoff exponencial
+        (RECONNECTION_INTERVAL * 2^tentativa, máx. 60s) até
+        MAX_RECONNECTION_ATTEMPTS falhas seguidas ou até disconnect().
+        """
+        self._start_dispatch_worker()
+        
+        # Marcado antes da checagem: um worker ainda vivo (ex.: em backoff
+        # logo após um disconnect) volta a conectar em vez de encerrar
+        self._ws_should_run = True
+        self._ws_reconnect_attempts = 0
+        
         if self.ws_thread and self.ws_thread.is_alive():
+            self._ws_wakeup.set()
             return
         
         def websocket_worker():
-            try:
-                # URL para stream múltiplo
-                symbols_lower = [s.lower() for s in TradingConfig.PUBLIC_SYMBOLS[:5]]  # Limita a 5 símbolos
-                streams = []
-                
-                for symbol in symbols_lower:
-                    streams.append(f"{symbol}@ticker")
-                    streams.append(f"{symbol}@kline_1m")
-                
-                stream_names = '/'.join(streams)
-                ws_url = f"wss://stream.binance.com:9443/stream?streams={stream_names}"
-                
-                def on_message(ws, message):
-                    try:
-                        data = json.loads(message)
-                        if 'stream' in data and 'data' in data:
-                            self._handle_websocket_message(data)
-                    except Exception as e:
-                        trading_logger.log_error(f"Erro ao processar mensagem WebSocket: {str(e)}", e)
+            while self._ws_should_run:
+                try:
+                    # Cria conexão WebSocket
+                    self.ws_connection = websocket.WebSocketApp(
+                        self._ws_url,
+                        on_open=self._on_ws_open,
+                        on_message=self._on_ws_message,
+                        on_error=self._on_ws_error,
+                        on_close=self._on_ws_close
+                    )
+                    
+                    # Ping/pong mantém a conexão viva; a Binance envia apenas UTF-8 válido
+                    self.ws_connection.run_forever(
+                        ping_interval=20,
+                        ping_timeout=10,
+                        skip_utf8_validation=True
+                    )
+                    
+                except Exception as e:
+                    trading_logger.log_error(f"Erro no WebSocket worker: {str(e)}", e)
                 
-                def on_error(ws, error):
-                    trading_logger.log_error(f"Erro WebSocket: {str(error)}")
+                # Descarta avisos recebidos com a conexão ainda ativa (ex.: novo
+                # início sem disconnect) para não pular o backoff a seguir
+                self._ws_wakeup.clear()
                 
-                def on_close(ws, close_status_code, close_msg):
-                    trading_logger.log_info("WebSocket público desconectado", 'api')
+                if not self._ws_should_run:
+                    break
                 
-                def on_open(ws):
-                    trading_logger.log_info("WebSocket público conectado", 'api')
+                attempt = self._ws_reconnect_attempts
+                if attempt >= TradingConfig.MAX_RECONNECTION_ATTEMPTS:
+                    trading_logger.log_error(
+                        f"WebSocket público: {attempt} tentativas de reconexão sem sucesso"
+                    )
+                    break
                 
-                # Cria conexão WebSocket
-                self.ws_connection = websocket.WebSocketApp(
-                    ws_url,
-                    on_open=on_open,
-                    on_message=on_message,
-                    on_error=on_error,
-                    on_close=on_close
+                delay = min(TradingConfig.RECONNECTION_INTERVAL * 2 ** attempt, 60)
+                trading_logger.log_warning(
+                    f"Reconectando WebSocket público em {delay}s (tentativa {attempt + 1})", 'api'
                 )
-                
-                self.ws_connection.run_forever()
-                
-            except Exception as e:
-                trading_logger.log_error(f"Erro no WebSocket worker: {str(e)}", e)
+                self._ws_wakeup.wait(delay)
+                self._ws_reconnect_attempts = attempt + 1
         
         self.ws_thread = threading.Thread(target=websocket_worker, daemon=True)
         self.ws_thread.start()
     
+    def _on_ws_open(self, ws):
+        """Callback de abertura do WebSocket público."""
+        self._ws_reconnect_attempts = 0
+        trading_logger.log_info("WebSocket público conectado", 'api')
+    
+    def _on_ws_message(self, ws, message: str):
+        """Callback de mensagem do WebSocket público."""
+        try:
+            self._handle_websocket_message(json.loads(message))
+        except Exception as e:
+            trading_logger.log_error(f"Erro ao processar mensagem WebSocket: {str(e)}", e)
+    
+    def _on_ws_error(self, ws, error):
+        """Callback de erro do WebSocket público."""
+        trading_logger.log_error(f"Erro WebSocket: {str(error)}")
+    
+    def _on_ws_close(self, ws, close_status_code, close_msg):
+        """Callback de fechamento do WebSocket público."""
+        trading_logger.log_info("WebSocket público desconectado", 'api')
+    
     def _handle_websocket_message(self, data: Dict):
-        """Processa mensagens do WebSocket."""
+        """
+        Processa mensagens do WebSocket.
+        
+        Apenas converte o frame em Tick/Candle e o enfileira; cache e
+        callbacks são tratados em lote por _dispatch_worker, fora da
+        thread de leitura do socket.
+        
+        Tickers e candles usam timestamps inteiros epoch em milissegundos
+        como enviados pela Binance; use ts_to_dt() para convertê-los em
+        datetime apenas na exibição.
+        """
+        try:
+            stream, stream_data = data['stream'], data['data']
+        except KeyError:
+            # Frames sem envelope de stream combinado (ex.: respostas de controle)
+            return
+        
         try:
-            stream = data.get('stream', '')
-            stream_data = data.get('data', {})
+            kind = stream.rpartition('@')[2]
             
-            if '@ticker' in stream:
+            if kind == 'ticker':
                 # Dados de ticker
-                symbol = stream_data.get('s')
-                if symbol:
-                    price_data = {
-                        'symbol': symbol,
-                        'price': float(stream_data.get('c', 0)),
-                        'change_percent': float(stream_data.get('P', 0)),
-                        'volume': float(stream_data.get('v', 0)),
-                        'timestamp': datetime.now()
-                    }
-                    
-                    self.price_cache[symbol] = price_data
-                    
-                    # Chama callbacks
-                    for callback in self.price_callbacks:
-                        try:
-                            callback(price_data)
-                        except Exception as e:
-                            trading_logger.log_error(f"Erro em callback de preço: {str(e)}", e)
-            
-            elif '@kline' in stream:
+                if stream_data.get('s'):
+                    self._event_queue.put(parse_ticker(stream_data))
+            
+            elif kind.startswith('kline'):
                 # Dados de candlestick
-                kline_data = stream_data.get('k', {})
+                kline_data = stream_data.get('k')
                 if kline_data:
-                    symbol = kline_data.get('s')
-                    
-                    candle = {
-                        'symbol': symbol,
-                        'timestamp': pd.to_datetime(kline_data.get('t'), unit='ms'),
-                        'open': float(kline_data.get('o', 0)),
-                        'high': float(kline_data.get('h', 0)),
-                        'low': float(kline_data.get('l', 0)),
-                        'close': float(kline_data.get('c', 0)),
-                        'volume': float(kline_data.get('v', 0)),
-                        'is_closed': kline_data.get('x', False)
-                    }
-                    
-                    # Armazena no cache
-                    if symbol not in self.kline_cache:
-                        self.kline_cache[symbol] = []
-                    
-                    self.kline_cache[symbol].append(candle)
-                    
-                    # Mantém apenas os últimos 100 candles
-                    if len(self.kline_cache[symbol]) > 100:
-                        self.kline_cache[symbol] = self.kline_cache[symbol][-100:]
-                    
-                    # Chama callbacks
-                    for callback in self.kline_callbacks:
-                        try:
-                            callback(candle)
-                        except Exception as e:
-                            trading_logger.log_error(f"Erro em callback de kline: {str(e)}", e)
+                    self._event_queue.put(parse_kline(kline_data))
                             
         except Exception as e:
             trading_logger.log_error(f"Erro ao processar mensagem WebSocket: {str(e)}", e)
     
+    def _start_dispatch_worker(self):
+        """Inicia a thread que drena a fila de eventos do WebSocket."""
+        thread = self._dispatch_thread
+        if thread and thread.is_alive():
+            if not self._dispatch_stopping:
+                return
+            # Parada pedida por disconnect(): o marcador já está na fila, então
+            # o worker antigo termina em breve; espera antes de criar o novo
+            # consumidor para não ficar sem nenhum
+            thread.join()
+        
+        self._dispatch_stopping = False
+        self._dispatch_thread = threading.Thread(target=self._dispatch_worker, daemon=True)
+        self._dispatch_thread.start()
+    
+    def _dispatch_worker(self):
+        """Drena a fila de eventos em lotes e os despacha."""
+        batch_size = TradingConfig.WS_DISPATCH_BATCH_SIZE
+        event_queue = self._event_queue
+        
+        while True:
+            # Bloqueia até o primeiro evento e completa o lote sem esperar
+            batch = [event_queue.get()]
+            while len(batch) < batch_size:
+                try:
+                    batch.append(event_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stop = _STOP_DISPATCH in batch
+            if stop:
+                batch = [event for event in batch if event is not _STOP_DISPATCH]
+            
+            try:
+                self._dispatch_batch(batch)
+            except Exception as e:
+                trading_logger.log_error(f"Erro ao despachar eventos WebSocket: {str(e)}", e)
+            
+            if stop:
+                return
+    
+    def _dispatch_batch(self, batch: List[Any]):
+        """
+        Atualiza caches e chama callbacks para um lote de eventos.
+        
+        Args:
+            batch: Lista de Tick/Candle na ordem de chegada
+        """
+        # Snapshot das tuplas de callbacks para todo o lote
+        price_callbacks = self.price_callbacks
+        kline_callbacks = self.kline_callbacks
+        
+        for event in batch:
+            if isinstance(event, Tick):
+                self.price_cache.put(event.symbol, event)
+                
+                for callback in price_callbacks:
+                    try:
+                        callback(event)
+                    except Exception as e:
+                        trading_logger.log_error(f"Erro em callback de preço: {str(e)}", e)
+            
+            else:
+                # Armazena no cache (deque mantém apenas os últimos candles)
+                candles = self.kline_cache.get(event.symbol)
+                if candles is None:
+                    candles = deque(maxlen=TradingConfig.KLINE_CACHE_CANDLES)
+                    self.kline_cache.put(event.symbol, candles)
+                
+                candles.append(event)
+                
+                for callback in kline_callbacks:
+                    try:
+                        callback(event)
+                    except Exception as e:
+                        trading_logger.log_error(f"Erro em callback de kline: {str(e)}", e)
+    
     def get_account_balance(self) -> Optional[Dict[str, Any]]:
         """Obtém saldo da conta (apenas modo autenticado)."""
         if not self.is_authenticated or not self._check_credentials_timeout():
@@ -456,16 +640,25 @@ class BinanceClient:
             
             trading_logger.log_api_request('fetch_balance', 'GET', 200, response_time)
             
-            # Filtra apenas moedas com saldo > 0
-            filtered_balance = {}
-            for currency, info in balance.items():
-                if isinstance(info, dict) and info.get('total', 0) > 0:
-                    filtered_balance[currency] = info
+            total_balance = balance.get('total') or {}
+            free_balance = balance.get('free') or {}
+            used_balance = balance.get('used') or {}
+            
+            # Filtra apenas moedas com saldo > 0 (uma passada sobre 'total')
+            filtered_balance = {
+                currency: {
+                    'total': total,
+                    'free': free_balance.get(currency, 0),
+                    'used': used_balance.get(currency, 0)
+                }
+                for currency, total in total_balance.items()
+                if total and total > 0
+            }
             
             return {
-                'total_balance': balance.get('total', {}),
-                'free_balance': balance.get('free', {}),
-                'used_balance': balance.get('used', {}),
+                'total_balance': total_balance,
+                'free_balance': free_balance,
+                'used_balance': used_balance,
                 'currencies': filtered_balance
             }
             
@@ -474,27 +667,37 @@ class BinanceClient:
             return None
     
     def add_price_callback(self, callback: Callable):
-        """Adiciona callback para atualizações de preço."""
-        self.price_callbacks.append(callback)
+        """Adiciona callback para atualizações de preço (copy-on-write)."""
+        self.price_callbacks = self.price_callbacks + (callback,)
     
     def add_kline_callback(self, callback: Callable):
-        """Adiciona callback para atualizações de candlestick."""
-        self.kline_callbacks.append(callback)
+        """Adiciona callback para atualizações de candlestick (copy-on-write)."""
+        self.kline_callbacks = self.kline_callbacks + (callback,)
     
-    def get_cached_price(self, symbol: str) -> Optional[Dict[str, Any]]:
+    def get_cached_price(self, symbol: str) -> Optional[Tick]:
         """Obtém preço do cache (WebSocket)."""
         return self.price_cache.get(symbol)
     
-    def get_cached_klines(self, symbol: str) -> List[Dict[str, Any]]:
+    def get_cached_klines(self, symbol: str) -> List[Candle]:
         """Obtém candlesticks do cache."""
-        return self.kline_cache.get(symbol, [])
+        candles = self.kline_cache.get(symbol)
+        return list(candles) if candles else []
     
     def disconnect(self):
         """Desconecta e limpa todos os recursos."""
         try:
+            # Impede a reconexão automática antes de fechar o socket
+            self._ws_should_run = False
+            self._ws_wakeup.set()
             if self.ws_connection:
                 self.ws_connection.close()
             
+            # Encerra a thread de dispatch após drenar a fila
+            if (self._dispatch_thread and self._dispatch_thread.is_alive()
+                    and not self._dispatch_stopping):
+                self._dispatch_stopping = True
+                self._event_queue.put(_STOP_DISPATCH)
+            
             self._clear_credentials()
             self.is_connected = False
             self.operation_mode = 'demo'
@@ -505,8 +708,8 @@ class BinanceClient:
             self.kline_cache.clear()
             
             # Limpa callbacks
-            self.price_callbacks.clear()
-            self.kline_callbacks.clear()
+            self.price_callbacks = ()
+            self.kline_callbacks = ()
             
             trading_logger.log_info("Cliente Binance desconectado completamente", 'api')
             
@@ -545,9 +748,7 @@ class BinanceClient:
             )
             
             if ohlcv:
-                df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-                df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-                df.set_index('timestamp', inplace=True)
+                df = ohlcv_to_frame(ohlcv)
                 
                 trading_logger.log_info(
                     f"Dados históricos autenticados obtidos: {symbol} - {len(df)} candles", 'api'
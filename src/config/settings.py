@@ -5,313 +5,557 @@ MÓDULO DE CONFIGURAÇÕES GLOBAIS - VERSÃO CLOUD CORRIGIDA
 Configurações completas e corrigidas para o sistema de trading.
 """
 
-import os
-from typing import Dict, List, Any
+from __future__ import annotations
 
-class TradingConfig:
+import re
+import hashlib
+import secrets
+import threading
+import functools
+from dataclasses import dataclass
+from sys import intern
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Mapping, Tuple, Any
+
+__all__ = [
+    # Classe de compatibilidade
+    'TradingConfig',
+    # Classes de configuração
+    'RiskSettings',
+    # Constantes
+    'BINANCE_API_URLS', 'BINANCE_WS_URLS', 'OPERATION_MODES',
+    'AVAILABLE_TIMEFRAMES', 'DEFAULT_TIMEFRAME', 'PUBLIC_SYMBOLS', 'DEFAULT_SYMBOLS',
+    'TIMEFRAME_SECONDS', 'OHLCV_TTL_MAX', 'OHLCV_TTL',
+    'MAX_HISTORICAL_CANDLES', 'REALTIME_UPDATE_INTERVAL',
+    'PRICE_CACHE_SIZE', 'SYMBOL_INFO_CACHE_SIZE', 'KLINE_CACHE_SYMBOLS',
+    'KLINE_CACHE_CANDLES', 'WS_DISPATCH_BATCH_SIZE',
+    'API_TIMEOUT', 'CCXT_RATE_LIMIT_MS', 'BINANCE_RECV_WINDOW',
+    'MAX_RECONNECTION_ATTEMPTS', 'RECONNECTION_INTERVAL', 'CREDENTIALS_TIMEOUT',
+    'STREAMLIT_CONFIG', 'BALANCE_TABLE_TOP_N', 'CHART_COLORS', 'DEFAULT_RISK_SETTINGS',
+    'PUBLIC_WEBSOCKET_STREAMS',
+    # Funções
+    'validate_credentials_format', 'clear_validation_cache', 'get_operation_mode_config',
+    'get_available_symbols', 'get_websocket_url', 'validate_symbol',
+    'validate_timeframe', 'get_safe_symbol', 'get_safe_timeframe',
+]
+
+# =============================================================================
+# UTILITÁRIOS INTERNOS
+# =============================================================================
+
+def _frozen_map(mapping: dict) -> Mapping[str, Any]:
+    """Congela um dicionário de configuração com as chaves internadas."""
+    return MappingProxyType({intern(key): value for key, value in mapping.items()})
+
+
+def _interned(*values: str) -> Tuple[str, ...]:
+    """Tupla de strings internadas (comparação por identidade nos lookups)."""
+    return tuple(intern(value) for value in values)
+
+
+# =============================================================================
+# CONFIGURAÇÕES DA API BINANCE
+# =============================================================================
+
+BINANCE_API_URLS = MappingProxyType({
+    'mainnet': 'https://api.binance.com',
+    'testnet': 'https://testnet.binance.vision',
+    'futures_mainnet': 'https://fapi.binance.com',
+    'futures_testnet': 'https://testnet.binancefuture.com'
+})
+
+# Apenas o stream público da mainnet é consumido (modo demo)
+BINANCE_WS_URLS = _frozen_map({
+    'public_mainnet': 'wss://stream.binance.com:9443/ws/',
+})
+
+# =============================================================================
+# MODOS DE OPERAÇÃO
+# =============================================================================
+
+OPERATION_MODES = _frozen_map({
+    'demo': MappingProxyType({
+        'name': 'Modo Demonstração',
+        'description': 'Dados públicos via WebSocket, sem autenticação',
+        'requires_api': False,
+        'features': ('charts', 'indicators', 'backtesting')
+    }),
+    'paper_trading': MappingProxyType({
+        'name': 'Paper Trading',
+        'description': 'Simulação com dados reais, sem ordens reais',
+        'requires_api': True,
+        'environment': 'testnet',
+        'features': ('charts', 'indicators', 'simulation')
+    }),
+    'live_trading': MappingProxyType({
+        'name': 'Trading Real',
+        'description': 'Operações reais com dinheiro real',
+        'requires_api': True,
+        'environment': 'mainnet',
+        'features': ('charts', 'indicators', 'real_orders')
+    })
+})
+
+# Configuração padrão (demo) resolvida uma única vez
+_DEMO_MODE_CFG = OPERATION_MODES['demo']
+
+# =============================================================================
+# CONFIGURAÇÕES DE TIMEFRAMES E SÍMBOLOS
+# =============================================================================
+
+AVAILABLE_TIMEFRAMES = _interned(
+    '1m', '3m', '5m', '15m', '30m', '1h', 
+    '2h', '4h', '6h', '8h', '12h', '1d', '3d', '1w', '1M'
+)
+
+DEFAULT_TIMEFRAME = '1h'
+
+# Símbolos disponíveis para modo público/demo
+PUBLIC_SYMBOLS = _interned(
+    'BTCUSDT', 'ETHUSDT', 'BNBUSDT', 'ADAUSDT', 'XRPUSDT',
+    'SOLUSDT', 'DOTUSDT', 'LINKUSDT', 'AVAXUSDT', 'LTCUSDT',
+    'BCHUSDT', 'XLMUSDT', 'VETUSDT', 'FILUSDT', 'TRXUSDT'
+)
+
+# Símbolos padrão para modos autenticados (públicos + extras)
+DEFAULT_SYMBOLS = PUBLIC_SYMBOLS + _interned(
+    'MATICUSDT', 'ATOMUSDT', 'NEARUSDT', 'SANDUSDT', 'MANAUSDT'
+)
+
+# Conjuntos para validação O(1) de símbolos e timeframes
+_PUBLIC_SYMBOLS_SET = frozenset(PUBLIC_SYMBOLS)
+_DEFAULT_SYMBOLS_SET = frozenset(DEFAULT_SYMBOLS)
+_TIMEFRAMES_SET = frozenset(AVAILABLE_TIMEFRAMES)
+_SYMBOL_SETS_BY_MODE = MappingProxyType({'demo': _PUBLIC_SYMBOLS_SET})
+
+# Símbolos em minúsculas (internados) para montagem de streams
+_SYMBOL_LOWER = MappingProxyType({
+    s: intern(s.lower()) for s in _PUBLIC_SYMBOLS_SET | _DEFAULT_SYMBOLS_SET
+})
+
+# =============================================================================
+# CONFIGURAÇÕES DE DADOS
+# =============================================================================
+
+MAX_HISTORICAL_CANDLES = 1000
+REALTIME_UPDATE_INTERVAL = 1
+
+# Duração de cada candle em segundos
+TIMEFRAME_SECONDS = _frozen_map({
+    '1m': 60, '3m': 180, '5m': 300, '15m': 900, '30m': 1800,
+    '1h': 3600, '2h': 7200, '4h': 14400, '6h': 21600, '8h': 28800,
+    '12h': 43200, '1d': 86400, '3d': 259200, '1w': 604800, '1M': 2592000
+})
+
+# Validade do cache de candles históricos: acompanha o período do candle,
+# limitada para que o candle em formação não fique desatualizado por horas
+OHLCV_TTL_MAX = 300
+OHLCV_TTL = _frozen_map({
+    timeframe: min(seconds, OHLCV_TTL_MAX)
+    for timeframe, seconds in TIMEFRAME_SECONDS.items()
+})
+
+# Limites dos caches em memória (LRU por símbolo)
+PRICE_CACHE_SIZE = 256
+SYMBOL_INFO_CACHE_SIZE = 512
+KLINE_CACHE_SYMBOLS = 128
+KLINE_CACHE_CANDLES = 100
+
+# Tamanho máximo do lote de eventos WebSocket despachados de uma vez
+WS_DISPATCH_BATCH_SIZE = 64
+
+# =============================================================================
+# CONFIGURAÇÕES DE SEGURANÇA
+# =============================================================================
+
+API_TIMEOUT = 30
+
+# Intervalo mínimo entre chamadas do ccxt (50ms = 1200 req/min, limite da Binance)
+CCXT_RATE_LIMIT_MS = 50
+BINANCE_RECV_WINDOW = 5000
+MAX_RECONNECTION_ATTEMPTS = 5
+RECONNECTION_INTERVAL = 5
+CREDENTIALS_TIMEOUT = 60
+
+# =============================================================================
+# CONFIGURAÇÕES DA INTERFACE
+# =============================================================================
+
+STREAMLIT_CONFIG = MappingProxyType({
+    'page_title': 'Professional Trading Bot',
+    'page_icon': '📈',
+    'layout': 'wide',
+    'initial_sidebar_state': 'expanded'
+})
+
+# Moedas exibidas na tabela de saldos antes de "Mostrar todas"
+BALANCE_TABLE_TOP_N = 20
+
+CHART_COLORS = MappingProxyType({
+    'bullish': '#00ff88',
+    'bearish': '#ff4444',
+    'neutral': '#ffaa00',
+    'background': '#0e1117',
+    'grid': '#262730',
+    'demo_mode': '#ffa500',
+    'paper_mode': '#00bfff',
+    'live_mode': '#ff4444'
+})
+
+# =============================================================================
+# CONFIGURAÇÕES DE TRADING
+# =============================================================================
+
+@dataclass(frozen=True)
+class RiskSettings:
+    """
+    Parâmetros de risco de uma sessão.
+    
+    Imutável: a instância padrão é compartilhada entre sessões e uma edição
+    gera uma nova instância com dataclasses.replace(). Ao contrário de um
+    MappingProxyType, pode ser serializada (pickle) no session_state.
     """
-    Classe principal de configurações - versão corrigida e completa.
+    max_position_size_percent: float = 2.0
+    max_daily_loss_percent: float = 5.0
+    max_open_positions: int = 3
+    default_stop_loss_percent: float = 2.0
+    default_take_profit_percent: float = 4.0
+
+
+DEFAULT_RISK_SETTINGS = RiskSettings()
+
+# =============================================================================
+# CONFIGURAÇÕES ESPECÍFICAS PARA WEBSOCKET PÚBLICO
+# =============================================================================
+
+PUBLIC_WEBSOCKET_STREAMS = _frozen_map({
+    'ticker': '@ticker',
+    'kline': '@kline_{}',
+    'depth': '@depth20@100ms',
+    'trades': '@trade',
+    'miniTicker': '@miniTicker'
+})
+
+# Montadores de URL por tipo: (symbol_lower, timeframe) -> URL completa,
+# derivados de PUBLIC_WEBSOCKET_STREAMS. str.join aloca a string final de
+# uma vez, sem intermediários; sufixos com "{}" recebem o timeframe (1m
+# por padrão).
+_BASE_WS = BINANCE_WS_URLS['public_mainnet']
+
+
+def _stream_builder(suffix: str):
+    """Cria o montador de URL de um sufixo de stream."""
+    if '{}' in suffix:
+        prefix, _, rest = suffix.partition('{}')
+        return lambda s, t: "".join((_BASE_WS, s, prefix, str(t) if t else "1m", rest))
+    return lambda s, t: "".join((_BASE_WS, s, suffix))
+
+
+_STREAM_BUILDERS = MappingProxyType({
+    stream_type: _stream_builder(suffix)
+    for stream_type, suffix in PUBLIC_WEBSOCKET_STREAMS.items()
+})
+
+# =============================================================================
+# VALIDAÇÃO DE CREDENCIAIS
+# =============================================================================
+
+# Qualquer espaço em branco (espaço, \n, \t, \r...) em uma única varredura
+_WHITESPACE_RE = re.compile(r'\s')
+
+# Primeiro caractere fora de [A-Za-z0-9] (interrompe a busca cedo)
+_NON_ALNUM_RE = re.compile(r'[^A-Za-z0-9]')
+
+# Resultado compartilhado do caso comum (credenciais válidas, sem avisos)
+_VALID_RESULT = MappingProxyType({'valid': True, 'errors': (), 'warnings': ()})
+
+# Cache dos resultados indexado por um digest das credenciais (as chaves
+# brutas nunca ficam armazenadas). O digest usa uma chave aleatória do
+# processo para não servir de hash reutilizável fora dele.
+_VALIDATION_CACHE_SIZE = 8
+_VALIDATION_DIGEST_KEY = secrets.token_bytes(32)
+_validation_cache: "OrderedDict[bytes, Mapping[str, Any]]" = OrderedDict()
+_validation_lock = threading.Lock()
+
+def _credentials_digest(api_key: str, api_secret: str) -> bytes:
+    """Digest BLAKE2b (com chave do processo) do par de credenciais."""
+    payload = f"{api_key or ''}\x00{api_secret or ''}".encode('utf-8')
+    return hashlib.blake2b(payload, key=_VALIDATION_DIGEST_KEY, digest_size=16).digest()
+
+
+def clear_validation_cache():
+    """Descarta os resultados de validação memoizados (ex.: no logout)."""
+    with _validation_lock:
+        _validation_cache.clear()
+
+
+def validate_credentials_format(api_key: str, api_secret: str) -> Mapping[str, Any]:
     """
+    Valida formato das credenciais sem testá-las.
     
-    # ==========================================================================
-    # CONFIGURAÇÕES DA API BINANCE
-    # ==========================================================================
-    
-    BINANCE_API_URLS = {
-        'mainnet': 'https://api.binance.com',
-        'testnet': 'https://testnet.binance.vision',
-        'futures_mainnet': 'https://fapi.binance.com',
-        'futures_testnet': 'https://testnet.binancefuture.com'
-    }
-    
-    BINANCE_WS_URLS = {
-        'public_mainnet': 'wss://stream.binance.com:9443/ws/',
-        'public_testnet': 'wss://testnet.binance.vision/ws/',
-        'futures_public': 'wss://fstream.binance.com/ws/',
-    }
-    
-    # ==========================================================================
-    # MODOS DE OPERAÇÃO
-    # ==========================================================================
-    
-    OPERATION_MODES = {
-        'demo': {
-            'name': 'Modo Demonstração',
-            'description': 'Dados públicos via WebSocket, sem autenticação',
-            'requires_api': False,
-            'features': ['charts', 'indicators', 'backtesting']
-        },
-        'paper_trading': {
-            'name': 'Paper Trading',
-            'description': 'Simulação com dados reais, sem ordens reais',
-            'requires_api': True,
-            'environment': 'testnet',
-            'features': ['charts', 'indicators', 'simulation']
-        },
-        'live_trading': {
-            'name': 'Trading Real',
-            'description': 'Operações reais com dinheiro real',
-            'requires_api': True,
-            'environment': 'mainnet',
-            'features': ['charts', 'indicators', 'real_orders']
-        }
-    }
-    
-    # ==========================================================================
-    # CONFIGURAÇÕES DE TIMEFRAMES E SÍMBOLOS
-    # ==========================================================================
-    
-    AVAILABLE_TIMEFRAMES = [
-        '1m', '3m', '5m', '15m', '30m', '1h', 
-        '2h', '4h', '6h', '8h', '12h', '1d', '3d', '1w', '1M'
-    ]
-    
-    DEFAULT_TIMEFRAME = '1h'
-    
-    # Símbolos disponíveis para modo público/demo
-    PUBLIC_SYMBOLS = [
-        'BTCUSDT', 'ETHUSDT', 'BNBUSDT', 'ADAUSDT', 'XRPUSDT',
-        'SOLUSDT', 'DOTUSDT', 'LINKUSDT', 'AVAXUSDT', 'LTCUSDT',
-        'BCHUSDT', 'XLMUSDT', 'VETUSDT', 'FILUSDT', 'TRXUSDT'
-    ]
-    
-    # Símbolos padrão para modos autenticados (mesmo que público por simplicidade)
-    DEFAULT_SYMBOLS = [
-        'BTCUSDT', 'ETHUSDT', 'BNBUSDT', 'ADAUSDT', 'XRPUSDT',
-        'SOLUSDT', 'DOTUSDT', 'LINKUSDT', 'AVAXUSDT', 'LTCUSDT',
-        'BCHUSDT', 'XLMUSDT', 'VETUSDT', 'FILUSDT', 'TRXUSDT',
-        'MATICUSDT', 'ATOMUSDT', 'NEARUSDT', 'SANDUSDT', 'MANAUSDT'
-    ]
-    
-    # ==========================================================================
-    # CONFIGURAÇÕES DE DADOS
-    # ==========================================================================
-    
-    MAX_HISTORICAL_CANDLES = 1000
-    REALTIME_UPDATE_INTERVAL = 1
-    
-    # ==========================================================================
-    # CONFIGURAÇÕES DE SEGURANÇA
-    # ==========================================================================
-    
-    API_TIMEOUT = 30
-    MAX_RECONNECTION_ATTEMPTS = 5
-    RECONNECTION_INTERVAL = 5
-    CREDENTIALS_TIMEOUT = 60
-    
-    # ==========================================================================
-    # CONFIGURAÇÕES DA INTERFACE
-    # ==========================================================================
-    
-    STREAMLIT_CONFIG = {
-        'page_title': 'Professional Trading Bot',
-        'page_icon': '📈',
-        'layout': 'wide',
-        'initial_sidebar_state': 'expanded'
-    }
-    
-    CHART_COLORS = {
-        'bullish': '#00ff88',
-        'bearish': '#ff4444',
-        'neutral': '#ffaa00',
-        'background': '#0e1117',
-        'grid': '#262730',
-        'demo_mode': '#ffa500',
-        'paper_mode': '#00bfff',
-        'live_mode': '#ff4444'
-    }
-    
-    # ==========================================================================
-    # CONFIGURAÇÕES DE TRADING
-    # ==========================================================================
-    
-    DEFAULT_RISK_SETTINGS = {
-        'max_position_size_percent': 2.0,
-        'max_daily_loss_percent': 5.0,
-        'max_open_positions': 3,
-        'default_stop_loss_percent': 2.0,
-        'default_take_profit_percent': 4.0
-    }
-    
-    # ==========================================================================
-    # CONFIGURAÇÕES ESPECÍFICAS PARA WEBSOCKET PÚBLICO
-    # ==========================================================================
-    
-    PUBLIC_WEBSOCKET_STREAMS = {
-        'ticker': '@ticker',
-        'kline': '@kline_{}',
-        'depth': '@depth20@100ms',
-        'trades': '@trade',
-        'miniTicker': '@miniTicker'
-    }
-    
-    # ==========================================================================
-    # MÉTODOS ESTÁTICOS
-    # ==========================================================================
-    
-    @classmethod
-    def get_operation_mode_config(cls, mode: str) -> Dict[str, Any]:
-        """
-        Obtém configuração específica do modo de operação.
-        
-        Args:
-            mode: Modo de operação ('demo', 'paper_trading', 'live_trading')
-            
-        Returns:
-            Configuração do modo selecionado
-        """
-        return cls.OPERATION_MODES.get(mode, cls.OPERATION_MODES['demo'])
-    
-    @classmethod
-    def get_available_symbols(cls, mode: str) -> List[str]:
-        """
-        Obtém símbolos disponíveis baseado no modo.
-        
-        Args:
-            mode: Modo de operação
-            
-        Returns:
-            Lista de símbolos disponíveis
-        """
-        if mode == 'demo':
-            return cls.PUBLIC_SYMBOLS
-        else:
-            return cls.DEFAULT_SYMBOLS
-    
-    @classmethod
-    def validate_credentials_format(cls, api_key: str, api_secret: str) -> Dict[str, Any]:
-        """
-        Valida formato das credenciais sem testá-las.
-        
-        Args:
-            api_key: Chave da API
-            api_secret: Segredo da API
-            
-        Returns:
-            Dicionário com resultado da validação
-        """
-        errors = []
-        warnings = []
-        
-        # Validação básica de formato
-        if not api_key or len(api_key.strip()) < 10:
-            errors.append("API Key deve ter pelo menos 10 caracteres")
-        
-        if not api_secret or len(api_secret.strip()) < 10:
-            errors.append("API Secret deve ter pelo menos 10 caracteres")
-        
-        # Validação de caracteres especiais suspeitos
-        if api_key:
-            api_key_clean = api_key.strip()
-            if ' ' in api_key_clean or '\n' in api_key_clean or '\t' in api_key_clean:
-                errors.append("API Key contém espaços ou caracteres inválidos")
-            
-            # Verifica se parece com uma chave real da Binance
-            if len(api_key_clean) > 0 and not api_key_clean.isalnum():
-                # Chaves da Binance geralmente são alfanuméricas
-                warnings.append("API Key contém caracteres especiais - verifique se está correta")
-        
-        if api_secret:
-            api_secret_clean = api_secret.strip()
-            if ' ' in api_secret_clean or '\n' in api_secret_clean or '\t' in api_secret_clean:
-                errors.append("API Secret contém espaços ou caracteres inválidos")
-        
-        return {
-            'valid': len(errors) == 0,
-            'errors': errors,
-            'warnings': warnings
-        }
-    
-    @classmethod
-    def get_websocket_url(cls, symbol: str, stream_type: str = 'ticker', 
-                         timeframe: str = None) -> str:
-        """
-        Gera URL do WebSocket baseada nos parâmetros.
+    Os últimos resultados ficam em um LRU pequeno indexado pelo digest
+    das credenciais; chame clear_validation_cache() ao encerrar a sessão.
+    O mapeamento retornado é compartilhado e não deve ser modificado.
+    
+    Args:
+        api_key: Chave da API
+        api_secret: Segredo da API
         
-        Args:
-            symbol: Símbolo da moeda
-            stream_type: Tipo de stream ('ticker', 'kline', etc.)
-            timeframe: Timeframe (para kline)
-            
-        Returns:
-            URL completa do WebSocket
-        """
-        base_url = cls.BINANCE_WS_URLS['public_mainnet']
-        symbol_lower = symbol.lower()
+    Returns:
+        Mapeamento com resultado da validação (somente leitura)
+    """
+    digest = _credentials_digest(api_key, api_secret)
+    
+    with _validation_lock:
+        cached = _validation_cache.get(digest)
+        if cached is not None:
+            _validation_cache.move_to_end(digest)
+            return cached
+    
+    result = _validate_credentials(api_key, api_secret)
+    
+    with _validation_lock:
+        _validation_cache[digest] = result
+        if len(_validation_cache) > _VALIDATION_CACHE_SIZE:
+            _validation_cache.popitem(last=False)
+    
+    return result
+
+
+def _validate_credentials(api_key: str, api_secret: str) -> Mapping[str, Any]:
+    """Executa as verificações de formato (sem cache)."""
+    errors = []
+    warnings = []
+    
+    # Validação básica de formato
+    if not api_key or len(api_key.strip()) < 10:
+        errors.append("API Key deve ter pelo menos 10 caracteres")
+    
+    if not api_secret or len(api_secret.strip()) < 10:
+        errors.append("API Secret deve ter pelo menos 10 caracteres")
+    
+    # Validação de caracteres especiais suspeitos
+    if api_key:
+        api_key_clean = api_key.strip()
+        if _WHITESPACE_RE.search(api_key_clean):
+            errors.append("API Key contém espaços ou caracteres inválidos")
         
-        if stream_type == 'kline' and timeframe:
-            stream = f"{symbol_lower}@kline_{timeframe}"
-        elif stream_type in cls.PUBLIC_WEBSOCKET_STREAMS:
-            stream_template = cls.PUBLIC_WEBSOCKET_STREAMS[stream_type]
-            if '{}' in stream_template:
-                stream = f"{symbol_lower}{stream_template.format(timeframe or '1m')}"
-            else:
-                stream = f"{symbol_lower}{stream_template}"
-        else:
-            # Default para ticker
-            stream = f"{symbol_lower}@ticker"
+        # Verifica se parece com uma chave real da Binance
+        if _NON_ALNUM_RE.search(api_key_clean) is not None:
+            # Chaves da Binance geralmente são alfanuméricas
+            warnings.append("API Key contém caracteres especiais - verifique se está correta")
+    
+    if api_secret:
+        api_secret_clean = api_secret.strip()
+        if _WHITESPACE_RE.search(api_secret_clean):
+            errors.append("API Secret contém espaços ou caracteres inválidos")
+    
+    if not errors and not warnings:
+        return _VALID_RESULT
+    
+    return MappingProxyType({
+        'valid': len(errors) == 0,
+        'errors': tuple(errors),
+        'warnings': tuple(warnings)
+    })
+
+
+# =============================================================================
+# FUNÇÕES DE CONFIGURAÇÃO
+# =============================================================================
+
+def get_operation_mode_config(mode: str) -> Mapping[str, Any]:
+    """
+    Obtém configuração específica do modo de operação.
+    
+    Args:
+        mode: Modo de operação ('demo', 'paper_trading', 'live_trading')
         
-        return f"{base_url}{stream}"
+    Returns:
+        Configuração do modo selecionado (somente leitura)
+    """
+    return OPERATION_MODES.get(mode, _DEMO_MODE_CFG)
+
+
+def get_available_symbols(mode: str) -> Tuple[str, ...]:
+    """
+    Obtém símbolos disponíveis baseado no modo.
     
-    @classmethod
-    def validate_symbol(cls, symbol: str, mode: str = 'demo') -> bool:
-        """
-        Valida se o símbolo está disponível no modo especificado.
+    Args:
+        mode: Modo de operação
         
-        Args:
-            symbol: Símbolo a validar
-            mode: Modo de operação
-            
-        Returns:
-            True se símbolo válido
-        """
-        available_symbols = cls.get_available_symbols(mode)
-        return symbol in available_symbols
-    
-    @classmethod
-    def validate_timeframe(cls, timeframe: str) -> bool:
-        """
-        Valida se o timeframe é suportado.
+    Returns:
+        Tupla (somente leitura) de símbolos disponíveis
+    """
+    if mode == 'demo':
+        return PUBLIC_SYMBOLS
+    else:
+        return DEFAULT_SYMBOLS
+
+
+@functools.lru_cache(maxsize=256)
+def _build_websocket_url(symbol: str, stream_type: str, timeframe: str) -> str:
+    """Monta a URL do WebSocket (memoizada por combinação de parâmetros)."""
+    # Tipos desconhecidos caem no ticker
+    builder = _STREAM_BUILDERS.get(stream_type, _STREAM_BUILDERS['ticker'])
+    symbol_lower = _SYMBOL_LOWER.get(symbol) or symbol.lower()
+    return builder(symbol_lower, timeframe)
+
+
+# URLs pré-montadas para todos os streams dos símbolos do modo demo
+# (montadas sem passar pelo LRU, que fica livre para as demais combinações)
+_URL_CACHE = MappingProxyType({
+    (symbol, stream_type, timeframe): _build_websocket_url.__wrapped__(symbol, stream_type, timeframe)
+    for symbol in PUBLIC_SYMBOLS
+    for stream_type in _STREAM_BUILDERS
+    for timeframe in ((None,) + AVAILABLE_TIMEFRAMES if stream_type == 'kline' else (None,))
+})
+
+
+def get_websocket_url(symbol: str, stream_type: str = 'ticker', 
+                      timeframe: str = None) -> str:
+    """
+    Gera URL do WebSocket baseada nos parâmetros.
+    
+    Streams dos símbolos públicos vêm de uma tabela pré-montada; as
+    demais combinações são montadas sob demanda e memoizadas.
+    
+    Args:
+        symbol: Símbolo da moeda
+        stream_type: Tipo de stream ('ticker', 'kline', etc.)
+        timeframe: Timeframe (para kline)
         
-        Args:
-            timeframe: Timeframe a validar
-            
-        Returns:
-            True se timeframe válido
-        """
-        return timeframe in cls.AVAILABLE_TIMEFRAMES
-    
-    @classmethod
-    def get_safe_symbol(cls, symbol: str, mode: str = 'demo') -> str:
-        """
-        Retorna um símbolo seguro, usando padrão se inválido.
+    Returns:
+        URL completa do WebSocket
+    """
+    return (_URL_CACHE.get((symbol, stream_type, timeframe))
+            or _build_websocket_url(symbol, stream_type, timeframe))
+
+
+def validate_symbol(symbol: str, mode: str = 'demo') -> bool:
+    """
+    Valida se o símbolo está disponível no modo especificado.
+    
+    Args:
+        symbol: Símbolo a validar
+        mode: Modo de operação
         
-        Args:
-            symbol: Símbolo desejado
-            mode: Modo de operação
-            
-        Returns:
-            Símbolo válido
-        """
-        if cls.validate_symbol(symbol, mode):
-            return symbol
+    Returns:
+        True se símbolo válido
+    """
+    return symbol in _SYMBOL_SETS_BY_MODE.get(mode, _DEFAULT_SYMBOLS_SET)
+
+
+def validate_timeframe(timeframe: str) -> bool:
+    """
+    Valida se o timeframe é suportado.
+    
+    Args:
+        timeframe: Timeframe a validar
         
-        # Retorna primeiro símbolo disponível como padrão
-        available_symbols = cls.get_available_symbols(mode)
-        return available_symbols[0] if available_symbols else 'BTCUSDT'
-    
-    @classmethod
-    def get_safe_timeframe(cls, timeframe: str) -> str:
-        """
-        Retorna um timeframe seguro, usando padrão se inválido.
+    Returns:
+        True se timeframe válido
+    """
+    return timeframe in _TIMEFRAMES_SET
+
+
+def get_safe_symbol(symbol: str, mode: str = 'demo') -> str:
+    """
+    Retorna um símbolo seguro, usando padrão se inválido.
+    
+    Args:
+        symbol: Símbolo desejado
+        mode: Modo de operação
         
-        Args:
-            timeframe: Timeframe desejado
-            
-        Returns:
-            Timeframe válido
-        """
-        if cls.validate_timeframe(timeframe):
-            return timeframe
+    Returns:
+        Símbolo válido
+    """
+    if symbol in _SYMBOL_SETS_BY_MODE.get(mode, _DEFAULT_SYMBOLS_SET):
+        return symbol
+    
+    # Retorna primeiro símbolo disponível como padrão
+    available_symbols = get_available_symbols(mode)
+    return available_symbols[0] if available_symbols else 'BTCUSDT'
+
+
+def get_safe_timeframe(timeframe: str) -> str:
+    """
+    Retorna um timeframe seguro, usando padrão se inválido.
+    
+    Args:
+        timeframe: Timeframe desejado
         
-        return cls.DEFAULT_TIMEFRAME
+    Returns:
+        Timeframe válido
+    """
+    return timeframe if timeframe in _TIMEFRAMES_SET else DEFAULT_TIMEFRAME
+
+
+# =============================================================================
+# COMPATIBILIDADE
+# =============================================================================
+
+class TradingConfig:
+    """
+    Fachada de compatibilidade sobre as configurações do módulo.
+    
+    As constantes e funções vivem em nível de módulo (acesso via
+    LOAD_GLOBAL); esta classe apenas as reexporta para o código que
+    ainda usa TradingConfig.X.
+    """
+    
+    # Configurações da API Binance
+    BINANCE_API_URLS = BINANCE_API_URLS
+    BINANCE_WS_URLS = BINANCE_WS_URLS
+    
+    # Modos de operação
+    OPERATION_MODES = OPERATION_MODES
+    
+    # Timeframes e símbolos
+    AVAILABLE_TIMEFRAMES = AVAILABLE_TIMEFRAMES
+    DEFAULT_TIMEFRAME = DEFAULT_TIMEFRAME
+    PUBLIC_SYMBOLS = PUBLIC_SYMBOLS
+    DEFAULT_SYMBOLS = DEFAULT_SYMBOLS
+    
+    # Dados
+    TIMEFRAME_SECONDS = TIMEFRAME_SECONDS
+    OHLCV_TTL_MAX = OHLCV_TTL_MAX
+    OHLCV_TTL = OHLCV_TTL
+    MAX_HISTORICAL_CANDLES = MAX_HISTORICAL_CANDLES
+    REALTIME_UPDATE_INTERVAL = REALTIME_UPDATE_INTERVAL
+    PRICE_CACHE_SIZE = PRICE_CACHE_SIZE
+    SYMBOL_INFO_CACHE_SIZE = SYMBOL_INFO_CACHE_SIZE
+    KLINE_CACHE_SYMBOLS = KLINE_CACHE_SYMBOLS
+    KLINE_CACHE_CANDLES = KLINE_CACHE_CANDLES
+    WS_DISPATCH_BATCH_SIZE = WS_DISPATCH_BATCH_SIZE
+    
+    # Segurança
+    API_TIMEOUT = API_TIMEOUT
+    CCXT_RATE_LIMIT_MS = CCXT_RATE_LIMIT_MS
+    BINANCE_RECV_WINDOW = BINANCE_RECV_WINDOW
+    MAX_RECONNECTION_ATTEMPTS = MAX_RECONNECTION_ATTEMPTS
+    RECONNECTION_INTERVAL = RECONNECTION_INTERVAL
+    CREDENTIALS_TIMEOUT = CREDENTIALS_TIMEOUT
+    
+    # Interface
+    STREAMLIT_CONFIG = STREAMLIT_CONFIG
+    BALANCE_TABLE_TOP_N = BALANCE_TABLE_TOP_N
+    CHART_COLORS = CHART_COLORS
+    
+    # Trading
+    DEFAULT_RISK_SETTINGS = DEFAULT_RISK_SETTINGS
+    
+    # WebSocket público
+    PUBLIC_WEBSOCKET_STREAMS = PUBLIC_WEBSOCKET_STREAMS
+    
+    # Funções
+    get_operation_mode_config = staticmethod(get_operation_mode_config)
+    get_available_symbols = staticmethod(get_available_symbols)
+    validate_credentials_format = staticmethod(validate_credentials_format)
+    clear_validation_cache = staticmethod(clear_validation_cache)
+    get_websocket_url = staticmethod(get_websocket_url)
+    validate_symbol = staticmethod(validate_symbol)
+    validate_timeframe = staticmethod(validate_timeframe)
+    get_safe_symbol = staticmethod(get_safe_symbol)
+    get_safe_timeframe = staticmethod(get_safe_timeframe)
@@ -5,138 +5,389 @@ DASHBOARD PRINCIPAL - VERSÃO COMPLETA E CORRIGIDA
 Interface completa do sistema de trading com todas as funcionalidades.
 """
 
+from __future__ import annotations
+
 import streamlit as st
+from streamlit.errors import StreamlitAPIException
 import pandas as pd
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import plotly.express as px
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from datetime import datetime
+from typing import Optional, Dict, Any
+import re
 import time
-import json
+import secrets
+import asyncio
+import threading
 import numpy as np
+import pyarrow as pa
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # Importações dos módulos do projeto - IMPORTS ABSOLUTOS CORRIGIDOS
 from config.settings import TradingConfig
-from api.binance_client import binance_client
+from api.binance_client import binance_client, Tick, ts_to_dt
 from utils.logger import trading_logger
 
+# Posições dos símbolos/timeframes válidos (consulta O(1) a cada rerun)
+_SYMBOL_IDX = {s: i for i, s in enumerate(TradingConfig.DEFAULT_SYMBOLS)}
+_TF_IDX = {t: i for i, t in enumerate(TradingConfig.AVAILABLE_TIMEFRAMES)}
+
+# Rótulos e posições dos modos de operação no seletor da barra lateral
+_MODE_LABELS = {
+    'demo': '📊 Modo Demo',
+    'paper_trading': '🧪 Paper Trading',
+    'live_trading': '⚡ Live Trading'
+}
+_MODE_OPTIONS = tuple(_MODE_LABELS)
+_MODE_IDX = {m: i for i, m in enumerate(_MODE_OPTIONS)}
+
+# Indicador de modo do cabeçalho: (classe CSS, título, subtítulo)
+_MODE_HEADERS = {
+    'demo': ('mode-demo', '📊 MODO DEMONSTRAÇÃO',
+             'Dados públicos • Sem autenticação • Ambiente seguro'),
+    'paper_trading': ('mode-paper', '🧪 PAPER TRADING - TESTNET',
+                      'Status: {status} • Simulação • Sem risco'),
+    'live_trading': ('mode-live', '⚡ TRADING REAL - MAINNET',
+                     'Status: {status} • DINHEIRO REAL • CUIDADO!')
+}
+
+# HTML já montado por (modo, autenticado); o cabeçalho só faz a consulta
+_MODE_HEADER_HTML = {
+    (mode, authenticated): (
+        f'<div class="{css_class}">{title}<br><small>'
+        + subtitle.format(status="CONECTADO" if authenticated else "DESCONECTADO")
+        + '</small></div>'
+    )
+    for mode, (css_class, title, subtitle) in _MODE_HEADERS.items()
+    for authenticated in (False, True)
+}
+
+# Formatação das colunas numéricas da tabela de saldos, aplicada pelo
+# frontend (sem Styler: nenhuma célula é formatada em Python). "localized"
+# mantém o separador de milhares; o step fixa as 8 casas decimais.
+_BALANCE_COLUMN_CONFIG = {
+    column: st.column_config.NumberColumn(column, format="localized", step=1e-8)
+    for column in ('Total', 'Livre', 'Usado')
+}
+
+# Intervalos oferecidos para a atualização automática do gráfico (segundos)
+_REFRESH_INTERVALS = (10, 30, 60, 120)
+
+# Intervalo mínimo (segundos) entre cliques em "Atualizar" para não estourar
+# os limites de peso da API da Binance
+_REFRESH_MIN_INTERVAL = 2.0
+
+# =============================================================================
+# CACHE DE DADOS
+# =============================================================================
+# Buscas de rede memoizadas pelo Streamlit: reruns causados por widgets não
+# refazem as chamadas REST. O modo faz parte da chave porque define a origem
+# dos dados (API pública ou autenticada); dados autenticados recebem ainda o
+# escopo da sessão, que só separa as entradas de cache de cada sessão (o
+# cliente Binance é único no processo e usa as últimas credenciais
+# autenticadas; o escopo não isola contas entre usuários).
+
+# Os spinners são exibidos por quem chama, na thread do script: as funções em
+# cache também rodam nas threads do pré-carregamento, de onde um spinner
+# cairia no container principal fora de ordem.
+
+# Validade do saldo em cache (segundos)
+_BALANCE_TTL = 15
+
+@st.cache_data(ttl=TradingConfig.OHLCV_TTL_MAX, max_entries=64, show_spinner=False)
+def _fetch_ohlcv_cached(mode: str, scope: Optional[str], symbol: str, timeframe: str,
+                        limit: int, bucket: int, nonce: float) -> Optional[pd.DataFrame]:
+    """Obtém candles históricos; `bucket` e `nonce` só participam da chave do cache."""
+    if mode == 'demo':
+        return binance_client.get_public_historical_data(symbol, timeframe, limit)
+    return binance_client.get_historical_data(symbol, timeframe, limit)
+
+
+def _ohlcv_cache_args(mode: str, symbol: str, timeframe: str, limit: int) -> tuple:
+    """
+    Monta os argumentos (chave) de _fetch_ohlcv_cached.
+    
+    O TTL do st.cache_data é fixo por função; a janela de tempo corrente
+    entra na chave para que cada timeframe expire no seu próprio ritmo
+    (60s para 1m, 300s para 5m ou maior).
+    
+    Um "Atualizar" da sessão grava o instante do clique; dentro da mesma
+    janela ele entra na chave e força uma busca nova só para esta sessão,
+    sem limpar o cache dos demais usuários.
+    """
+    ttl = TradingConfig.OHLCV_TTL.get(timeframe, 60)
+    bucket = int(time.time() // ttl)
+    
+    refreshed_at = st.session_state.get('_refreshed_at', 0.0)
+    nonce = refreshed_at if int(refreshed_at // ttl) == bucket else 0.0
+    
+    return (mode, _cache_scope(mode), symbol, timeframe, limit, bucket, nonce)
+
+
+def _fetch_ohlcv(mode: str, symbol: str, timeframe: str, limit: int) -> Optional[pd.DataFrame]:
+    """Obtém candles históricos com validade igual ao período do candle."""
+    # O spinner só aparece após 0.5s, então acertos no cache não o exibem
+    with st.spinner("📊 Carregando dados históricos..."):
+        return _fetch_ohlcv_cached(*_ohlcv_cache_args(mode, symbol, timeframe, limit))
+
+
+def _force_refresh():
+    """Marca candles e saldo da sessão para nova busca (ver *_cache_args)."""
+    st.session_state['_refreshed_at'] = time.time()
+
+
+@st.cache_data(ttl=_BALANCE_TTL, max_entries=16, show_spinner=False)
+def _fetch_balance(mode: str, scope: Optional[str], nonce: float) -> Optional[Dict[str, Any]]:
+    """Obtém o saldo da conta autenticada (cache de 15s por modo/sessão)."""
+    return binance_client.get_account_balance()
+
+
+def _balance_cache_args(mode: str) -> tuple:
+    """
+    Monta os argumentos (chave) de _fetch_balance.
+    
+    O instante do último "Atualizar" da sessão entra como nonce: a sessão
+    busca um saldo novo sem limpar o cache das demais.
+    """
+    return (mode, _cache_scope(mode), st.session_state.get('_refreshed_at', 0.0))
+
+
+def _cache_scope(mode: str) -> Optional[str]:
+    """
+    Escopo do cache: compartilhado no modo demo, por sessão nos demais.
+    
+    Apenas particiona as entradas do cache; as buscas continuam passando
+    pelo binance_client global (ver CACHE DE DADOS).
+    """
+    if mode == 'demo':
+        return None
+    scope = st.session_state.get('_cache_scope')
+    if scope is None:
+        scope = st.session_state['_cache_scope'] = secrets.token_hex(8)
+    return scope
+
+
+def _prefetch_authenticated(mode: str, symbol: str, timeframe: str, limit: int):
+    """
+    Aquece em paralelo os caches de candles e de saldo quando algum está frio.
+    
+    As duas chamadas REST são independentes; com asyncio.gather o primeiro
+    render autenticado espera a mais lenta, não a soma das duas. A sessão
+    guarda as chaves dos dois caches e o instante do último aquecimento: com
+    as mesmas chaves e o saldo ainda dentro do TTL, nada é disparado. Mudanças
+    de modo, logout e "Atualizar" trocam a chave (escopo ou nonce).
+    """
+    ohlcv_args = _ohlcv_cache_args(mode, symbol, timeframe, limit)
+    balance_args = _balance_cache_args(mode)
+    now = time.monotonic()
+    
+    last_args, last_time = st.session_state.get('_prefetched', (None, 0.0))
+    if last_args == (ohlcv_args, balance_args) and now - last_time < _BALANCE_TTL:
+        return
+    
+    ctx = get_script_run_ctx()
+    
+    def call_with_ctx(fetch, *args):
+        # Threads do executor precisam do contexto da execução atual
+        add_script_run_ctx(threading.current_thread(), ctx)
+        return fetch(*args)
+    
+    async def gather():
+        await asyncio.gather(
+            asyncio.to_thread(call_with_ctx, _fetch_ohlcv_cached, *ohlcv_args),
+            asyncio.to_thread(call_with_ctx, _fetch_balance, *balance_args)
+        )
+    
+    with st.spinner("🔄 Carregando dados da conta..."):
+        asyncio.run(gather())
+    
+    st.session_state['_prefetched'] = ((ohlcv_args, balance_args), now)
+
+
+# =============================================================================
+# ESTILOS
+# =============================================================================
+# CSS montado uma vez no import. O Streamlit remove na rerun seguinte
+# qualquer elemento que não seja emitido de novo, então o bloco continua
+# sendo enviado a cada execução; por isso ele é minificado no import
+# (sem comentários e espaços) para reduzir o que vai a cada rerun.
+
+_CSS = """
+<style>
+/* Cabeçalho principal */
+.main-header {
+    font-size: 2.8rem;
+    font-weight: bold;
+    background: linear-gradient(90deg, #00ff88, #00cc6a);
+    -webkit-background-clip: text;
+    -webkit-text-fill-color: transparent;
+    text-align: center;
+    margin-bottom: 2rem;
+    text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+}
+
+/* Indicadores de modo */
+.mode-demo {
+    background: linear-gradient(135deg, #ffa500, #ff8c00);
+    color: white;
+    padding: 1rem;
+    border-radius: 10px;
+    text-align: center;
+    font-weight: bold;
+    margin: 1rem 0;
+    box-shadow: 0 4px 8px rgba(0,0,0,0.2);
+}
+
+.mode-paper {
+    background: linear-gradient(135deg, #00bfff, #0080ff);
+    color: white;
+    padding: 1rem;
+    border-radius: 10px;
+    text-align: center;
+    font-weight: bold;
+    margin: 1rem 0;
+    box-shadow: 0 4px 8px rgba(0,0,0,0.2);
+}
+
+.mode-live {
+    background: linear-gradient(135deg, #ff4444, #cc0000);
+    color: white;
+    padding: 1rem;
+    border-radius: 10px;
+    text-align: center;
+    font-weight: bold;
+    margin: 1rem 0;
+    box-shadow: 0 4px 8px rgba(0,0,0,0.2);
+    animation: pulse 2s infinite;
+}
+
+@keyframes pulse {
+    0% { box-shadow: 0 4px 8px rgba(255,68,68,0.2); }
+    50% { box-shadow: 0 4px 20px rgba(255,68,68,0.4); }
+    100% { box-shadow: 0 4px 8px rgba(255,68,68,0.2); }
+}
+
+/* Caixas de informação */
+.security-box {
+    background: linear-gradient(135deg, #2d5a2d, #1a4a1a);
+    border-left: 5px solid #00ff88;
+    padding: 1.5rem;
+    border-radius: 10px;
+    margin: 1rem 0;
+    box-shadow: 0 2px 10px rgba(0,255,136,0.1);
+}
+
+.info-box {
+    background: linear-gradient(135deg, #2d4a5a, #1a3a4a);
+    border-left: 5px solid #00bfff;
+    padding: 1.5rem;
+    border-radius: 10px;
+    margin: 1rem 0;
+    box-shadow: 0 2px 10px rgba(0,191,255,0.1);
+}
+
+.warning-box {
+    background: linear-gradient(135deg, #5a4d2d, #4a3d1a);
+    border-left: 5px solid #ffaa00;
+    padding: 1.5rem;
+    border-radius: 10px;
+    margin: 1rem 0;
+    box-shadow: 0 2px 10px rgba(255,170,0,0.1);
+}
+
+/* Grade de métricas estáticas (um único elemento HTML) */
+.metric-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(140px, 1fr));
+    gap: 1rem;
+    margin-bottom: 1rem;
+}
+
+.metric-card .metric-label {
+    font-size: 0.875rem;
+    opacity: 0.8;
+}
+
+.metric-card .metric-value {
+    font-size: 1.75rem;
+    line-height: 1.6;
+}
+</style>
+"""
+
+# Remove comentários e espaços supérfluos (o CSS não usa strings nem url())
+_CSS = re.sub(r'/\*.*?\*/', '', _CSS, flags=re.S)
+_CSS = re.sub(r'\s*([{}:;,>])\s*', r'\1', _CSS)
+_CSS = re.sub(r'\s+', ' ', _CSS).replace(';}', '}').strip()
+
+
+# Configuração do Plotly no navegador: sem barra de ferramentas e sem os
+# modos de seleção que o dashboard não usa
+_CHART_CONFIG = {
+    'displayModeBar': False,
+    'displaylogo': False,
+    'scrollZoom': True,
+    'doubleClick': 'reset',
+    'modeBarButtonsToRemove': ['select2d', 'lasso2d', 'autoScale2d']
+}
+
+
+def _metric_grid(items) -> str:
+    """
+    Monta a grade HTML de métricas estáticas.
+    
+    Um único st.markdown substitui st.columns + um st.metric por valor.
+    O "$" vira entidade HTML para o Markdown não interpretá-lo como LaTeX.
+    
+    Args:
+        items: Pares (rótulo, valor já formatado)
+    
+    Returns:
+        HTML da grade
+    """
+    cards = "".join(
+        f'<div class="metric-card"><div class="metric-label">{label}</div>'
+        f'<div class="metric-value">{str(value).replace("$", "&#36;")}</div></div>'
+        for label, value in items
+    )
+    return f'<div class="metric-grid">{cards}</div>'
+
+
 class TradingDashboard:
     """
     Dashboard completo e profissional para sistema de trading.
     Interface responsiva com todas as funcionalidades implementadas.
-    """
     
-    def __init__(self):
-        """Inicializa o dashboard"""
-        self.setup_page_config()
-        self.initialize_session_state()
-        self.setup_custom_css()
+    A instância é compartilhada entre reruns (ver get_dashboard); todo
+    estado por sessão fica em st.session_state e os elementos de página
+    são emitidos em run().
+    """
     
     def setup_page_config(self):
-        """Configura a página do Streamlit"""
-        st.set_page_config(
-            page_title="Professional Trading Bot",
-            page_icon="📈",
-            layout="wide",
-            initial_sidebar_state="expanded",
-            menu_items={
-                'Get Help': 'https://github.com/your-repo',
-                'Report a bug': 'https://github.com/your-repo/issues',
-                'About': "Professional Trading Bot v1.0"
-            }
-        )
+        """Configura a página do Streamlit (apenas na primeira chamada da execução)"""
+        try:
+            st.set_page_config(
+                **TradingConfig.STREAMLIT_CONFIG,
+                menu_items={
+                    'Get Help': 'https://github.com/your-repo',
+                    'Report a bug': 'https://github.com/your-repo/issues',
+                    'About': "Professional Trading Bot v1.0"
+                }
+            )
+        except StreamlitAPIException:
+            # set_page_config já foi chamado nesta execução
+            pass
     
     def setup_custom_css(self):
         """CSS customizado para interface profissional"""
-        st.markdown("""
-        <style>
-        /* Cabeçalho principal */
-        .main-header {
-            font-size: 2.8rem;
-            font-weight: bold;
-            background: linear-gradient(90deg, #00ff88, #00cc6a);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            text-align: center;
-            margin-bottom: 2rem;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-        }
-        
-        /* Indicadores de modo */
-        .mode-demo {
-            background: linear-gradient(135deg, #ffa500, #ff8c00);
-            color: white;
-            padding: 1rem;
-            border-radius: 10px;
-            text-align: center;
-            font-weight: bold;
-            margin: 1rem 0;
-            box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-        }
-        
-        .mode-paper {
-            background: linear-gradient(135deg, #00bfff, #0080ff);
-            color: white;
-            padding: 1rem;
-            border-radius: 10px;
-            text-align: center;
-            font-weight: bold;
-            margin: 1rem 0;
-            box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-        }
-        
-        .mode-live {
-            background: linear-gradient(135deg, #ff4444, #cc0000);
-            color: white;
-            padding: 1rem;
-            border-radius: 10px;
-            text-align: center;
-            font-weight: bold;
-            margin: 1rem 0;
-            box-shadow: 0 4px 8px rgba(0,0,0,0.2);
-            animation: pulse 2s infinite;
-        }
-        
-        @keyframes pulse {
-            0% { box-shadow: 0 4px 8px rgba(255,68,68,0.2); }
-            50% { box-shadow: 0 4px 20px rgba(255,68,68,0.4); }
-            100% { box-shadow: 0 4px 8px rgba(255,68,68,0.2); }
-        }
-        
-        /* Caixas de informação */
-        .security-box {
-            background: linear-gradient(135deg, #2d5a2d, #1a4a1a);
-            border-left: 5px solid #00ff88;
-            padding: 1.5rem;
-            border-radius: 10px;
-            margin: 1rem 0;
-            box-shadow: 0 2px 10px rgba(0,255,136,0.1);
-        }
-        
-        .info-box {
-            background: linear-gradient(135deg, #2d4a5a, #1a3a4a);
-            border-left: 5px solid #00bfff;
-            padding: 1.5rem;
-            border-radius: 10px;
-            margin: 1rem 0;
-            box-shadow: 0 2px 10px rgba(0,191,255,0.1);
-        }
-        
-        .warning-box {
-            background: linear-gradient(135deg, #5a4d2d, #4a3d1a);
-            border-left: 5px solid #ffaa00;
-            padding: 1.5rem;
-            border-radius: 10px;
-            margin: 1rem 0;
-            box-shadow: 0 2px 10px rgba(255,170,0,0.1);
-        }
-        </style>
-        """, unsafe_allow_html=True)
+        st.markdown(_CSS, unsafe_allow_html=True)
     
     def initialize_session_state(self):
         """Inicializa todas as variáveis de estado da sessão"""
-        # Configurações principais
+        # Executa uma vez por sessão; reruns saem logo aqui
+        if st.session_state.get('dashboard_initialized'):
+            return
+        
+        # Configurações principais (montadas aqui, e não em nível de módulo,
+        # para cada sessão receber suas próprias listas/dicionários)
         session_defaults = {
             'operation_mode': 'demo',
             'selected_symbol': 'BTCUSDT',
@@ -145,12 +396,7 @@ class TradingDashboard:
             'is_testnet': True,
             'account_type': 'spot',
             
-            # Dados de mercado
-            'historical_data': None,
-            'current_price_data': None,
-            
             # Dados da conta
-            'account_balance': None,
             'open_orders': [],
             
             # Interface
@@ -159,8 +405,9 @@ class TradingDashboard:
             'auto_refresh': False,
             'refresh_interval': 30,
             
-            # Configurações de risco
-            'risk_settings': TradingConfig.DEFAULT_RISK_SETTINGS.copy(),
+            # Configurações de risco: instância imutável compartilhada; uma
+            # edição grava dataclasses.replace(...) em vez de alterar esta
+            'risk_settings': TradingConfig.DEFAULT_RISK_SETTINGS,
             
             # Estado de inicialização
             'dashboard_initialized': False,
@@ -170,21 +417,16 @@ class TradingDashboard:
         
         # Aplica valores padrão apenas se não existirem
         for key, default_value in session_defaults.items():
-            if key not in st.session_state:
-                st.session_state[key] = default_value
+            st.session_state.setdefault(key, default_value)
         
         # Marca como inicializado
-        if not st.session_state.get('dashboard_initialized', False):
-            st.session_state.dashboard_initialized = True
-            st.session_state.last_update = datetime.now()
-            trading_logger.log_info("Dashboard inicializado com sucesso")
+        st.session_state.dashboard_initialized = True
+        st.session_state.last_update = datetime.now()
+        trading_logger.log_info("Dashboard inicializado com sucesso")
     
     def safe_get_session_state(self, key: str, default=None):
         """Obtém valor do session_state de forma segura"""
-        try:
-            return getattr(st.session_state, key, default)
-        except AttributeError:
-            return default
+        return st.session_state.get(key, default)
     
     def render_header(self):
         """Renderiza cabeçalho principal com status"""
@@ -196,32 +438,11 @@ class TradingDashboard:
         
         col1, col2, col3 = st.columns([1, 2, 1])
         
-        with col2:
-            if current_mode == 'demo':
-                st.markdown("""
-                <div class="mode-demo">
-                    📊 MODO DEMONSTRAÇÃO<br>
-                    <small>Dados públicos • Sem autenticação • Ambiente seguro</small>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            elif current_mode == 'paper_trading':
-                auth_status = "CONECTADO" if binance_client.is_authenticated else "DESCONECTADO"
-                st.markdown(f"""
-                <div class="mode-paper">
-                    🧪 PAPER TRADING - TESTNET<br>
-                    <small>Status: {auth_status} • Simulação • Sem risco</small>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            elif current_mode == 'live_trading':
-                auth_status = "CONECTADO" if binance_client.is_authenticated else "DESCONECTADO"
-                st.markdown(f"""
-                <div class="mode-live">
-                    ⚡ TRADING REAL - MAINNET<br>
-                    <small>Status: {auth_status} • DINHEIRO REAL • CUIDADO!</small>
-                </div>
-                """, unsafe_allow_html=True)
+        header_html = _MODE_HEADER_HTML.get((current_mode, binance_client.is_authenticated))
+        
+        if header_html:
+            with col2:
+                st.markdown(header_html, unsafe_allow_html=True)
     
     def render_mode_selection_sidebar(self):
         """Renderiza seleção de modo de operação"""
@@ -246,33 +467,43 @@ class TradingDashboard:
             - ⚠️ **ATENÇÃO: RISCO REAL!**
             """)
         
-        current_mode = self.safe_get_session_state('operation_mode', 'demo')
-        
-        mode_options = {
-            'demo': '📊 Modo Demo',
-            'paper_trading': '🧪 Paper Trading',
-            'live_trading': '⚡ Live Trading'
-        }
+        if st.session_state.get('operation_mode') not in _MODE_IDX:
+            st.session_state.operation_mode = 'demo'
         
-        selected_mode = st.sidebar.selectbox(
+        # O callback roda antes da execução que já exibe o novo modo; não há
+        # rerun extra nem pausa para mostrar a confirmação
+        st.sidebar.selectbox(
             "Selecione o modo:",
-            options=list(mode_options.keys()),
-            format_func=lambda x: mode_options[x],
-            index=list(mode_options.keys()).index(current_mode)
+            options=_MODE_OPTIONS,
+            format_func=_MODE_LABELS.__getitem__,
+            key='operation_mode',
+            on_change=self._on_mode_change
         )
+    
+    @staticmethod
+    def _on_mode_change():
+        """Reconfigura o cliente e descarta o estado do modo anterior"""
+        selected_mode = st.session_state.operation_mode
         
-        if selected_mode != current_mode:
-            st.session_state.operation_mode = selected_mode
-            st.session_state.authenticated = False
-            st.session_state.account_balance = None
-            st.session_state.historical_data = None
-            
-            # Configura cliente
-            binance_client.set_operation_mode(selected_mode)
-            
-            st.sidebar.success(f"Modo alterado para: {mode_options[selected_mode]}")
-            time.sleep(1)
-            st.rerun()
+        st.session_state.authenticated = False
+        st.session_state.pop('_cache_scope', None)
+        _fetch_balance.clear()
+        
+        # Configura cliente
+        binance_client.set_operation_mode(selected_mode)
+        
+        st.toast(f"Modo alterado para: {_MODE_LABELS[selected_mode]}")
+    
+    @staticmethod
+    def _select_mode(mode: str):
+        """
+        Troca o modo a partir dos botões da tela inicial.
+        
+        Roda como callback (antes do script), quando ainda é permitido
+        alterar a chave do seletor de modo da barra lateral.
+        """
+        st.session_state.operation_mode = mode
+        TradingDashboard._on_mode_change()
     
     def render_authentication_sidebar(self):
         """Renderiza painel de autenticação"""
@@ -341,7 +572,9 @@ class TradingDashboard:
                     placeholder="Insira seu API Secret..."
                 )
                 
-                # Validação em tempo real
+                # Validação única por execução do formulário, reaproveitada no
+                # envio (o resultado já é memoizado em settings por digest)
+                validation = None
                 if api_key or api_secret:
                     validation = TradingConfig.validate_credentials_format(api_key, api_secret)
                     if not validation['valid']:
@@ -359,8 +592,6 @@ class TradingDashboard:
                 
                 if connect_button:
                     if api_key and api_secret:
-                        validation = TradingConfig.validate_credentials_format(api_key, api_secret)
-                        
                         if validation['valid']:
                             with st.spinner("🔄 Conectando com a Binance..."):
                                 result = binance_client.authenticate(
@@ -372,9 +603,11 @@ class TradingDashboard:
                                 st.session_state.is_testnet = is_testnet
                                 st.session_state.account_type = account_type
                                 
-                                st.success(f"✅ {result['message']}")
-                                st.info(f"⏱️ Tempo de resposta: {result['response_time']:.2f}s")
-                                time.sleep(2)
+                                # Toast não bloqueia e sobrevive ao rerun
+                                st.toast(
+                                    f"{result['message']} ({result['response_time']:.2f}s)",
+                                    icon="✅"
+                                )
                                 st.rerun()
                             else:
                                 st.error(f"❌ {result['message']}")
@@ -390,144 +623,108 @@ class TradingDashboard:
             if st.sidebar.button("🔓 Sair", use_container_width=True):
                 binance_client.disconnect()
                 st.session_state.authenticated = False
-                st.session_state.account_balance = None
-                st.sidebar.success("👋 Desconectado com segurança!")
-                time.sleep(1)
+                st.session_state.pop('_cache_scope', None)
+                _fetch_balance.clear()
+                st.toast("Desconectado com segurança!", icon="👋")
                 st.rerun()
     
     def render_trading_controls_sidebar(self):
         """Renderiza controles de trading"""
         st.sidebar.markdown("## 📊 Controles de Trading")
         
-        current_mode = self.safe_get_session_state('operation_mode', 'demo')
-        current_symbol = self.safe_get_session_state('selected_symbol', 'BTCUSDT')
-        current_timeframe = self.safe_get_session_state('selected_timeframe', '1h')
-        
-        # Símbolos disponíveis
-        available_symbols = TradingConfig.DEFAULT_SYMBOLS
+        # Valores fora das opções (ex.: símbolo removido da configuração)
+        # voltam ao padrão antes de os widgets lerem o session_state
+        if st.session_state.get('selected_symbol') not in _SYMBOL_IDX:
+            st.session_state.selected_symbol = TradingConfig.DEFAULT_SYMBOLS[0]
+        if st.session_state.get('selected_timeframe') not in _TF_IDX:
+            st.session_state.selected_timeframe = TradingConfig.DEFAULT_TIMEFRAME
         
-        # Seleção de símbolo
-        symbol = st.sidebar.selectbox(
+        # Seleção de símbolo: o widget escreve direto em selected_symbol e o
+        # callback só dispara quando o valor realmente muda
+        st.sidebar.selectbox(
             "💱 Símbolo:",
-            available_symbols,
-            index=available_symbols.index(current_symbol) if current_symbol in available_symbols else 0,
+            TradingConfig.DEFAULT_SYMBOLS,
+            key='selected_symbol',
             help=f"Escolha o par de moedas para análise"
         )
         
-        if symbol != current_symbol:
-            st.session_state.selected_symbol = symbol
-            st.session_state.historical_data = None
-            st.session_state.current_price_data = None
-        
         # Seleção de timeframe
-        timeframe = st.sidebar.selectbox(
+        st.sidebar.selectbox(
             "⏰ Timeframe:",
             TradingConfig.AVAILABLE_TIMEFRAMES,
-            index=TradingConfig.AVAILABLE_TIMEFRAMES.index(current_timeframe),
+            key='selected_timeframe',
             help="Intervalo de tempo para os candles"
         )
         
-        if timeframe != current_timeframe:
-            st.session_state.selected_timeframe = timeframe
-            st.session_state.historical_data = None
+        # Atualização automática: reexecuta só o fragmento do gráfico
+        st.sidebar.toggle(
+            "🔁 Atualização automática",
+            key='auto_refresh',
+            help="Atualiza o gráfico periodicamente sem recarregar a página"
+        )
+        if st.session_state.get('auto_refresh'):
+            # O Streamlit apaga a chave enquanto o controle fica oculto
+            st.session_state.setdefault('refresh_interval', 30)
+            st.sidebar.select_slider(
+                "Intervalo (segundos):",
+                options=_REFRESH_INTERVALS,
+                key='refresh_interval'
+            )
         
         # Botões de ação
         st.sidebar.markdown("---")
         
         if st.sidebar.button("🔄 Atualizar", use_container_width=True):
-            st.session_state.historical_data = None
-            st.session_state.current_price_data = None
-            st.session_state.account_balance = None
-            st.session_state.last_update = datetime.now()
-            st.sidebar.success("✅ Atualizando...")
-            st.rerun()
+            now = time.monotonic()
+            last_refresh = st.session_state.get('_last_refresh', 0.0)
+            
+            if now - last_refresh < _REFRESH_MIN_INTERVAL:
+                st.toast(f"⏳ Aguarde {_REFRESH_MIN_INTERVAL:.0f}s entre atualizações")
+            else:
+                st.session_state['_last_refresh'] = now
+                _force_refresh()
+                st.session_state.last_update = datetime.now()
+                st.toast("Atualizando...", icon="✅")
+                st.rerun()
     
     def render_price_chart(self):
-        """Renderiza gráfico de preços principal"""
+        """
+        Renderiza gráfico de preços principal.
+        
+        Fragmento: interações dentro do gráfico não reexecutam o restante
+        da página; mudanças na barra lateral continuam refazendo tudo. Com a
+        atualização automática ligada, o fragmento se reexecuta sozinho no
+        intervalo escolhido (o run_every é definido a cada execução).
+        """
+        run_every = None
+        if self.safe_get_session_state('auto_refresh', False):
+            run_every = self.safe_get_session_state('refresh_interval', 30)
+        
+        st.fragment(self._render_price_chart_body, run_every=run_every)()
+    
+    def _render_price_chart_body(self):
+        """Conteúdo do fragmento do gráfico (ver render_price_chart)"""
         current_symbol = self.safe_get_session_state('selected_symbol', 'BTCUSDT')
         current_timeframe = self.safe_get_session_state('selected_timeframe', '1h')
         current_mode = self.safe_get_session_state('operation_mode', 'demo')
         
         st.markdown(f"## 📈 {current_symbol} - {current_timeframe}")
         
-        # Carrega dados se necessário
-        if st.session_state.historical_data is None:
-            with st.spinner("📊 Carregando dados históricos..."):
-                if current_mode == 'demo':
-                    st.session_state.historical_data = binance_client.get_public_historical_data(
-                        current_symbol, current_timeframe, 500
-                    )
-                else:
-                    st.session_state.historical_data = binance_client.get_historical_data(
-                        current_symbol, current_timeframe, 500
-                    )
-                
-                # Atualiza preço atual
-                st.session_state.current_price_data = binance_client.get_current_price(current_symbol)
-        
-        df = st.session_state.historical_data
+        # Carrega dados (memoizados por modo/símbolo/timeframe)
+        df = _fetch_ohlcv(current_mode, current_symbol, current_timeframe, 500)
         
         if df is not None and not df.empty:
             try:
-                # Cria gráfico
-                fig = make_subplots(
-                    rows=2, cols=1,
-                    shared_xaxes=True,
-                    vertical_spacing=0.05,
-                    subplot_titles=(f'{current_symbol} - {current_timeframe}', 'Volume'),
-                    row_heights=[0.75, 0.25]
-                )
-                
-                # Candlestick
-                candlestick = go.Candlestick(
-                    x=df.index,
-                    open=df['open'],
-                    high=df['high'],
-                    low=df['low'],
-                    close=df['close'],
-                    name="Preço",
-                    increasing_line_color=TradingConfig.CHART_COLORS['bullish'],
-                    decreasing_line_color=TradingConfig.CHART_COLORS['bearish']
-                )
-                
-                fig.add_trace(candlestick, row=1, col=1)
-                
-                # Volume
-                colors = [TradingConfig.CHART_COLORS['bearish'] if close < open 
-                         else TradingConfig.CHART_COLORS['bullish'] 
-                         for close, open in zip(df['close'], df['open'])]
-                
-                volume_bars = go.Bar(
-                    x=df.index,
-                    y=df['volume'],
-                    name="Volume",
-                    marker_color=colors,
-                    opacity=0.7,
-                    showlegend=False
-                )
+                # Esqueleto reaproveitado entre reruns; só os dados mudam
+                fig = self._get_price_figure(current_symbol, current_timeframe, df)
                 
-                fig.add_trace(volume_bars, row=2, col=1)
-                
-                # Layout do gráfico
-                fig.update_layout(
-                    title=f"{current_symbol} - {current_timeframe}",
-                    yaxis_title="Preço (USDT)",
-                    yaxis2_title="Volume",
-                    template="plotly_dark",
-                    height=700,
-                    showlegend=False,
-                    xaxis_rangeslider_visible=False,
-                    hovermode='x unified'
+                # Exibe o gráfico; a key fixa mantém o mesmo componente no
+                # navegador entre reruns (atualização via Plotly.react, sem
+                # remontar o gráfico)
+                st.plotly_chart(
+                    fig, use_container_width=True, config=_CHART_CONFIG, key='price_chart'
                 )
                 
-                fig.update_xaxes(type='date')
-                
-                # Exibe o gráfico
-                st.plotly_chart(fig, use_container_width=True)
-                
-                # Métricas básicas
-                self.render_basic_metrics(df)
-                
             except Exception as e:
                 st.error(f"❌ Erro ao criar gráfico: {str(e)}")
                 trading_logger.log_error(f"Erro no gráfico: {str(e)}", e)
@@ -536,43 +733,221 @@ class TradingDashboard:
             st.error("❌ Não foi possível carregar os dados do gráfico")
             
             if st.button("🔄 Tentar Novamente", type="primary"):
-                st.session_state.historical_data = None
+                _force_refresh()
                 st.rerun()
     
-    def render_basic_metrics(self, df: pd.DataFrame):
-        """Renderiza métricas básicas"""
+    @staticmethod
+    @st.cache_resource(show_spinner=False, max_entries=32)
+    def _build_price_figure(symbol: str, timeframe: str):
+        """
+        Cria o esqueleto do gráfico (subplots, traces vazios e layout).
+        
+        Recurso compartilhado entre sessões e tratado como somente leitura:
+        cada sessão trabalha sobre uma cópia (ver _get_price_figure).
+        
+        Args:
+            symbol: Símbolo exibido
+            timeframe: Timeframe exibido
+            
+        Returns:
+            Figura Plotly sem dados
+        """
+        # Plotly só é carregado quando há gráfico para desenhar
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+        
+        fig = make_subplots(
+            rows=2, cols=1,
+            shared_xaxes=True,
+            vertical_spacing=0.05,
+            subplot_titles=(f'{symbol} - {timeframe}', 'Volume'),
+            row_heights=[0.75, 0.25]
+        )
+        
+        # Candlestick
+        fig.add_trace(
+            go.Candlestick(
+                increasing_line_color=TradingConfig.CHART_COLORS['bullish'],
+                decreasing_line_color=TradingConfig.CHART_COLORS['bearish']
+            ),
+            row=1, col=1
+        )
+        
+        # Volume
+        fig.add_trace(
+            go.Bar(
+                marker_line_width=0,
+                opacity=0.7,
+                hoverinfo='skip'
+            ),
+            row=2, col=1
+        )
+        
+        # Layout do gráfico
+        fig.update_layout(
+            title=f"{symbol} - {timeframe}",
+            yaxis_title="Preço (USDT)",
+            yaxis2_title="Volume",
+            template="plotly_dark",
+            height=700,
+            showlegend=False,
+            xaxis_rangeslider_visible=False,
+            hovermode='x unified',
+            # Zoom/pan do usuário sobrevivem aos reruns enquanto o par e o
+            # timeframe não mudarem
+            uirevision=f"{symbol}:{timeframe}"
+        )
+        
+        fig.update_xaxes(type='date')
+        
+        return fig
+    
+    def _get_price_figure(self, symbol: str, timeframe: str, df: pd.DataFrame):
+        """
+        Obtém a figura do gráfico, reaproveitando o esqueleto da sessão.
+        
+        O esqueleto fica em st.session_state por (symbol, timeframe); a cada
+        rerun apenas os arrays dos traces são substituídos, e nem isso
+        quando os candles são os mesmos da execução anterior.
+        
+        Args:
+            symbol: Símbolo exibido
+            timeframe: Timeframe exibido
+            df: Candles a exibir
+            
+        Returns:
+            Figura Plotly com os dados atuais
+        """
+        key = (symbol, timeframe)
+        cached = st.session_state.get('_chart_fig')
+        
+        # Assinatura barata dos dados: a cópia vinda do st.cache_data muda de
+        # identidade a cada rerun, mas não de conteúdo até o TTL expirar
+        signature = (len(df), df.index[-1], df['close'].iat[-1], df['volume'].iat[-1])
+        
+        if cached is None or cached[0] != key:
+            import plotly.graph_objects as go
+            
+            # Copiar o esqueleto em cache sai mais barato que refazer
+            # make_subplots + layout a cada troca de par/timeframe
+            cached = (key, go.Figure(self._build_price_figure(symbol, timeframe)), None)
+        elif cached[2] == signature:
+            # Arrays e cores já calculados para estes candles
+            return cached[1]
+        
+        fig = cached[1]
+        st.session_state['_chart_fig'] = (key, fig, signature)
+        
+        # Eixo x como epoch em ms (o eixo já é type='date'), sem formatar
+        # cada timestamp como string ISO na serialização
+        x_epoch = df.index.to_numpy().astype('datetime64[ms]').astype(np.int64)
+        
+        # Colunas materializadas uma vez como arrays float64 (o ccxt pode
+        # entregar inteiros no volume)
+        opens = df['open'].to_numpy(np.float64)
+        highs = df['high'].to_numpy(np.float64)
+        lows = df['low'].to_numpy(np.float64)
+        closes = df['close'].to_numpy(np.float64)
+        volumes = df['volume'].to_numpy(np.float64)
+        
+        # Cores do volume vetorizadas: vermelho quando fecha abaixo da abertura
+        colors = np.where(
+            closes < opens,
+            TradingConfig.CHART_COLORS['bearish'],
+            TradingConfig.CHART_COLORS['bullish']
+        )
+        
+        candlestick, volume_bars = fig.data
+        
+        with fig.batch_update():
+            candlestick.x = x_epoch
+            candlestick.open = opens
+            candlestick.high = highs
+            candlestick.low = lows
+            candlestick.close = closes
+            
+            volume_bars.x = x_epoch
+            volume_bars.y = volumes
+            volume_bars.marker.color = colors
+        
+        return fig
+    
+    def render_live_metrics(self):
+        """
+        Atualiza periodicamente as métricas do último candle.
+        
+        Roda em fragmento próprio: só o slot das métricas é reescrito, o
+        gráfico (500 candles) não é reenviado. O preço vem do último tick
+        do WebSocket, que só existe no modo demo e para os símbolos
+        assinados; fora disso o fragmento não se reexecuta sozinho.
+        """
+        symbol = self.safe_get_session_state('selected_symbol', 'BTCUSDT')
+        has_ticks = (
+            self.safe_get_session_state('operation_mode', 'demo') == 'demo'
+            and symbol in binance_client.streamed_symbols
+        )
+        
+        st.fragment(self._render_live_metrics_body, run_every="2s" if has_ticks else None)()
+    
+    def _render_live_metrics_body(self):
+        """Conteúdo do fragmento das métricas (ver render_live_metrics)"""
+        symbol = self.safe_get_session_state('selected_symbol', 'BTCUSDT')
+        df = _fetch_ohlcv(
+            self.safe_get_session_state('operation_mode', 'demo'),
+            symbol,
+            self.safe_get_session_state('selected_timeframe', '1h'),
+            500
+        )
+        # Uma única leitura do tick: métricas e rodapé usam o mesmo instante
+        tick = binance_client.get_cached_price(symbol)
+        
+        metrics_slot = st.empty()
+        with metrics_slot.container():
+            self.render_basic_metrics(df, tick)
+            
+            if tick is not None and tick.timestamp:
+                tick_time = ts_to_dt(tick.timestamp).strftime("%H:%M:%S")
+                st.caption(f"🟢 Tempo real · último tick às {tick_time}")
+    
+    def render_basic_metrics(self, df: pd.DataFrame, tick: Optional[Tick] = None):
+        """
+        Renderiza métricas básicas.
+        
+        Args:
+            df: Candles do símbolo selecionado
+            tick: Último tick em tempo real (substitui o fechamento do último candle)
+        """
         if df is None or df.empty:
             return
         
-        current_price = df['close'].iloc[-1]
-        prev_price = df['close'].iloc[-2] if len(df) > 1 else current_price
+        closes = df['close'].to_numpy(np.float64)
+        current_price = tick.price if tick is not None else closes[-1]
+        prev_price = closes[-2] if len(closes) > 1 else closes[-1]
         price_change = current_price - prev_price
         price_change_pct = (price_change / prev_price) * 100 if prev_price != 0 else 0
         
-        high_24h = df['high'].iloc[-1]
-        low_24h = df['low'].iloc[-1]
-        volume_24h = df['volume'].iloc[-1]
+        high_24h = max(df['high'].iat[-1], current_price)
+        low_24h = min(df['low'].iat[-1], current_price)
+        volume_24h = df['volume'].iat[-1]
         
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric(
-                "💰 Preço Atual",
-                f"${current_price:.4f}",
-                delta=f"{price_change:+.4f} ({price_change_pct:+.2f}%)"
-            )
-        
-        with col2:
-            st.metric("📈 Máxima", f"${high_24h:.4f}")
+        # Preço em tempo real segue como st.metric (com delta); os demais
+        # valores vão em um único bloco HTML
+        price_col, grid_col = st.columns([1, 3])
         
-        with col3:
-            st.metric("📉 Mínima", f"${low_24h:.4f}")
-        
-        with col4:
-            st.metric("📊 Volume", f"{volume_24h:,.0f}")
+        price_col.metric(
+            "💰 Preço Atual",
+            f"${current_price:.4f}",
+            delta=f"{price_change:+.4f} ({price_change_pct:+.2f}%)"
+        )
+        grid_col.markdown(_metric_grid((
+            ("📈 Máxima", f"${high_24h:.4f}"),
+            ("📉 Mínima", f"${low_24h:.4f}"),
+            ("📊 Volume", f"{volume_24h:,.0f}")
+        )), unsafe_allow_html=True)
     
+    @st.fragment
     def render_account_info(self):
-        """Renderiza informações da conta"""
+        """Renderiza informações da conta (fragmento isolado do gráfico)"""
         current_mode = self.safe_get_session_state('operation_mode', 'demo')
         
         if current_mode == 'demo':
@@ -602,60 +977,74 @@ class TradingDashboard:
         
         st.markdown("## 💰 Informações da Conta")
         
-        # Carrega dados do saldo
-        if st.session_state.account_balance is None:
-            with st.spinner("💰 Carregando informações da conta..."):
-                st.session_state.account_balance = binance_client.get_balance()
-        
-        balance_data = st.session_state.account_balance
+        # Carrega dados do saldo (memoizados por modo)
+        with st.spinner("💰 Carregando informações da conta..."):
+            balance_data = _fetch_balance(*_balance_cache_args(current_mode))
         
         if balance_data:
             # Resumo principal
-            total_balance = balance_data.get('total', {})
-            free_balance = balance_data.get('free', {})
-            used_balance = balance_data.get('used', {})
+            total_balance = balance_data.get('total_balance', {})
+            free_balance = balance_data.get('free_balance', {})
+            used_balance = balance_data.get('used_balance', {})
             
             # Métricas USDT
             usdt_total = total_balance.get('USDT', 0)
             usdt_free = free_balance.get('USDT', 0)
             usdt_used = used_balance.get('USDT', 0)
             
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.metric("💵 USDT Total", f"${usdt_total:.2f}")
-            
-            with col2:
-                st.metric("💸 USDT Livre", f"${usdt_free:.2f}")
-            
-            with col3:
-                st.metric("🔒 USDT Usado", f"${usdt_used:.2f}")
+            currencies_count = len(balance_data.get('currencies', {}))
             
-            with col4:
-                currencies_count = len(balance_data.get('currencies', {}))
-                st.metric("🪙 Moedas", currencies_count)
+            st.markdown(_metric_grid((
+                ("💵 USDT Total", f"${usdt_total:.2f}"),
+                ("💸 USDT Livre", f"${usdt_free:.2f}"),
+                ("🔒 USDT Usado", f"${usdt_used:.2f}"),
+                ("🪙 Moedas", currencies_count)
+            )), unsafe_allow_html=True)
             
             # Tabela de saldos
             if balance_data.get('currencies'):
                 st.markdown("### 📋 Saldos Detalhados")
                 
-                balance_list = []
-                for currency, info in balance_data['currencies'].items():
-                    balance_list.append({
-                        'Moeda': currency,
-                        'Total': f"{info.get('total', 0):.8f}",
-                        'Livre': f"{info.get('free', 0):.8f}",
-                        'Usado': f"{info.get('used', 0):.8f}"
-                    })
+                # Monta a tabela por colunas (uma coluna float64 por campo)
+                currencies = balance_data['currencies']
+                count = len(currencies)
+                infos = currencies.values()
+                
+                names = np.fromiter(currencies.keys(), dtype=object, count=count)
+                totals = np.fromiter((i.get('total') or 0 for i in infos), dtype=np.float64, count=count)
+                frees = np.fromiter((i.get('free') or 0 for i in infos), dtype=np.float64, count=count)
+                useds = np.fromiter((i.get('used') or 0 for i in infos), dtype=np.float64, count=count)
                 
-                df_balance = pd.DataFrame(balance_list)
-                st.dataframe(df_balance, use_container_width=True)
+                # Maiores saldos primeiro
+                order = np.argsort(-totals, kind='stable')
+                
+                # Por padrão envia só as maiores posições (saldos "poeira" ficam ocultos)
+                show_all = count > TradingConfig.BALANCE_TABLE_TOP_N and st.toggle(
+                    f"Mostrar todas as {count} moedas", key="show_all_balances"
+                )
+                if not show_all:
+                    order = order[:TradingConfig.BALANCE_TABLE_TOP_N]
+                
+                # Tabela Arrow direto das colunas: o st.dataframe serializa
+                # sem passar por DataFrame/inferência de schema do pandas
+                table = pa.table({
+                    'Moeda': pa.array(names[order], type=pa.string()),
+                    'Total': totals[order],
+                    'Livre': frees[order],
+                    'Usado': useds[order]
+                })
+                
+                st.dataframe(
+                    table,
+                    use_container_width=True,
+                    column_config=_BALANCE_COLUMN_CONFIG
+                )
         
         else:
             st.error("❌ Erro ao carregar informações da conta")
             
             if st.button("🔄 Tentar Novamente", type="primary"):
-                st.session_state.account_balance = None
+                _force_refresh()
                 st.rerun()
     
     def render_welcome_screen(self):
@@ -702,26 +1091,29 @@ class TradingDashboard:
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            if st.button("📊 Iniciar Demo", type="primary", use_container_width=True):
-                st.session_state.operation_mode = 'demo'
-                binance_client.set_operation_mode('demo')
-                st.rerun()
+            st.button(
+                "📊 Iniciar Demo", type="primary", use_container_width=True,
+                on_click=self._select_mode, args=('demo',)
+            )
         
         with col2:
-            if st.button("🧪 Paper Trading", use_container_width=True):
-                st.session_state.operation_mode = 'paper_trading'
-                st.rerun()
+            st.button(
+                "🧪 Paper Trading", use_container_width=True,
+                on_click=self._select_mode, args=('paper_trading',)
+            )
         
         with col3:
-            if st.button("⚡ Live Trading", use_container_width=True):
-                st.session_state.operation_mode = 'live_trading'
-                st.rerun()
+            st.button(
+                "⚡ Live Trading", use_container_width=True,
+                on_click=self._select_mode, args=('live_trading',)
+            )
     
     def run(self):
         """Executa o dashboard principal"""
         try:
-            # Garante inicialização
+            # Garante inicialização e estilos (reemitidos a cada execução)
             self.initialize_session_state()
+            self.setup_custom_css()
             
             # Renderiza componentes principais
             self.render_header()
@@ -738,16 +1130,25 @@ class TradingDashboard:
                 
                 with tab1:
                     self.render_price_chart()
+                    self.render_live_metrics()
                 
                 with tab2:
                     self.render_account_info()
             
             elif binance_client.is_authenticated:
                 # Modo autenticado - funcionalidades completas
+                _prefetch_authenticated(
+                    current_mode,
+                    self.safe_get_session_state('selected_symbol', 'BTCUSDT'),
+                    self.safe_get_session_state('selected_timeframe', '1h'),
+                    500
+                )
+                
                 tab1, tab2 = st.tabs(["📊 Dashboard", "💰 Conta"])
                 
                 with tab1:
                     self.render_price_chart()
+                    self.render_live_metrics()
                 
                 with tab2:
                     self.render_account_info()
@@ -764,5 +1165,19 @@ class TradingDashboard:
             if st.button("🔄 Recarregar Sistema", type="primary"):
                 st.rerun()
 
-# Instância global do dashboard - REMOVIDA PARA EVITAR CONFLITOS
-# dashboard = TradingDashboard()
+
+# =============================================================================
+# INSTÂNCIA DO DASHBOARD
+# =============================================================================
+
+@st.cache_resource(show_spinner=False)
+def get_dashboard() -> TradingDashboard:
+    """Retorna a instância única do dashboard, criada na primeira execução."""
+    return TradingDashboard()
+
+
+def render_dashboard():
+    """Ponto de entrada: configura a página e executa o dashboard."""
+    dashboard = get_dashboard()
+    dashboard.setup_page_config()
+    dashboard.run()
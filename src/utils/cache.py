@@ -0,0 +1,81 @@
+"""
+=============================================================================
+MÓDULO DE CACHE EM MEMÓRIA
+=============================================================================
+Estruturas de cache com tamanho limitado para dados de mercado
+mantidos durante sessões longas (trading 24/7).
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Iterator, Optional
+
+class LRUCache:
+    """
+    Cache LRU (least recently used) com capacidade fixa.
+    Ao exceder a capacidade, a entrada usada há mais tempo é descartada.
+    """
+    
+    def __init__(self, capacity: int):
+        """
+        Inicializa o cache.
+        
+        Args:
+            capacity: Número máximo de entradas mantidas
+        """
+        if capacity <= 0:
+            raise ValueError("capacity deve ser maior que zero")
+        
+        self.capacity = capacity
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Obtém um valor e o marca como usado recentemente.
+        
+        Args:
+            key: Chave buscada
+            default: Valor retornado se a chave não existir
+        
+        Returns:
+            Valor armazenado ou default
+        """
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                return default
+            return self._data[key]
+    
+    def put(self, key: Hashable, value: Any):
+        """
+        Armazena um valor, descartando a entrada mais antiga se necessário.
+        
+        Args:
+            key: Chave
+            value: Valor a armazenar
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.capacity:
+                self._data.popitem(last=False)
+    
+    def __setitem__(self, key: Hashable, value: Any):
+        self.put(key, value)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __iter__(self) -> Iterator[Hashable]:
+        with self._lock:
+            return iter(list(self._data))
+    
+    def clear(self):
+        """Remove todas as entradas."""
+        with self._lock:
+            self._data.clear()